@@ -1,19 +1,88 @@
-from records.field import Factory
-from records.fillers.builtin_fillers.std_fillers import (LiteralEval, Eval, FromInteger, Loose, LooseUnpack,
-                                                         LooseUnpackMap, Falsish, Whole)
-from records.fillers.builtin_validators import Clamp, Cyclic, FullMatch, Truth, Within
-from records.fillers.coercers import CallCoercion, ClassMethodCoercion, ComposeCoercer, MapCoercion
-from records.fillers.filler import TypeCheckStyle
-from records.fillers.validators import AssertCallValidation, AssertValidation, CallValidation, ValidationToken
-from records.record import RecordBase, parser, exclude_from_ordering
-from records.select import SelectableFactory
-from records.tags import Tag
-from records.utils.typing_compatible import Annotated
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from records._version import __version__
 
-check = TypeCheckStyle.check
-check_strict = TypeCheckStyle.check_strict
-hollow = TypeCheckStyle.hollow
+if TYPE_CHECKING:  # pragma: no cover
+    from records.field import Factory
+    from records.fillers.builtin_fillers.std_fillers import (LiteralEval, Eval, FromInteger, Loose, LooseUnpack,
+                                                             LooseUnpackMap, Falsish, Whole)
+    from records.fillers.builtin_validators import Clamp, Cyclic, FullMatch, Truth, Within
+    from records.fillers.coercers import CallCoercion, ClassMethodCoercion, ComposeCoercer, MapCoercion
+    from records.fillers.filler import TypeCheckStyle
+    from records.fillers.validators import AssertCallValidation, AssertValidation, CallValidation, ValidationToken
+    from records.record import RecordBase, parser, exclude_from_ordering
+    from records.select import SelectableFactory
+    from records.tags import Tag
+    from records.utils.typing_compatible import Annotated
+
+    check = TypeCheckStyle.check
+    check_strict = TypeCheckStyle.check_strict
+    hollow = TypeCheckStyle.hollow
+
+_lazy_attributes = {
+    'Factory': ('records.field', 'Factory'),
+
+    'LiteralEval': ('records.fillers.builtin_fillers.std_fillers', 'LiteralEval'),
+    'Eval': ('records.fillers.builtin_fillers.std_fillers', 'Eval'),
+    'FromInteger': ('records.fillers.builtin_fillers.std_fillers', 'FromInteger'),
+    'Loose': ('records.fillers.builtin_fillers.std_fillers', 'Loose'),
+    'LooseUnpack': ('records.fillers.builtin_fillers.std_fillers', 'LooseUnpack'),
+    'LooseUnpackMap': ('records.fillers.builtin_fillers.std_fillers', 'LooseUnpackMap'),
+    'Falsish': ('records.fillers.builtin_fillers.std_fillers', 'Falsish'),
+    'Whole': ('records.fillers.builtin_fillers.std_fillers', 'Whole'),
+
+    'Clamp': ('records.fillers.builtin_validators', 'Clamp'),
+    'Cyclic': ('records.fillers.builtin_validators', 'Cyclic'),
+    'FullMatch': ('records.fillers.builtin_validators', 'FullMatch'),
+    'Truth': ('records.fillers.builtin_validators', 'Truth'),
+    'Within': ('records.fillers.builtin_validators', 'Within'),
+
+    'CallCoercion': ('records.fillers.coercers', 'CallCoercion'),
+    'ClassMethodCoercion': ('records.fillers.coercers', 'ClassMethodCoercion'),
+    'ComposeCoercer': ('records.fillers.coercers', 'ComposeCoercer'),
+    'MapCoercion': ('records.fillers.coercers', 'MapCoercion'),
+
+    'TypeCheckStyle': ('records.fillers.filler', 'TypeCheckStyle'),
+    'check': ('records.fillers.filler', 'TypeCheckStyle.check'),
+    'check_strict': ('records.fillers.filler', 'TypeCheckStyle.check_strict'),
+    'hollow': ('records.fillers.filler', 'TypeCheckStyle.hollow'),
+
+    'AssertCallValidation': ('records.fillers.validators', 'AssertCallValidation'),
+    'AssertValidation': ('records.fillers.validators', 'AssertValidation'),
+    'CallValidation': ('records.fillers.validators', 'CallValidation'),
+    'ValidationToken': ('records.fillers.validators', 'ValidationToken'),
+
+    'RecordBase': ('records.record', 'RecordBase'),
+    'parser': ('records.record', 'parser'),
+    'exclude_from_ordering': ('records.record', 'exclude_from_ordering'),
+
+    'SelectableFactory': ('records.select', 'SelectableFactory'),
+    'Tag': ('records.tags', 'Tag'),
+    'Annotated': ('records.utils.typing_compatible', 'Annotated'),
+}
+"""
+A mapping of the package's public names to the module and attribute path they are imported from. Names are only
+ imported on first access, so that importing the package does not load all of its submodules.
+"""
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute_path = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    ret = import_module(module_name)
+    for part in attribute_path.split('.'):
+        ret = getattr(ret, part)
+    # store the result so this function is only called once per name
+    globals()[name] = ret
+    return ret
+
+
+def __dir__():
+    return sorted(set(globals()).union(__all__))
+
 
 __all__ = [
     'RecordBase', 'Annotated', 'Factory', 'parser', 'exclude_from_ordering',
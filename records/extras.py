@@ -8,10 +8,24 @@ decode with `ujson <https://github.com/ultrajson/ultrajson>`_ use the following
 
 All extras default to their standard library implementations. Any overridden members must fully support the default's
 API.
+
+.. note::
+    The default libraries are only imported when first accessed.
 """
 
-import json
-import pickle
-import re
+from importlib import import_module
+
+_defaults = frozenset(('json', 'pickle', 're'))
+"""the names of the standard library modules that are used by default"""
+
+
+def __getattr__(name):
+    # this is only called for extras that have not been accessed or overridden yet
+    if name not in _defaults:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    ret = import_module(name)
+    globals()[name] = ret
+    return ret
+
 
-__all__ = ['json', 'pickle', 're']
+__all__ = ['json', 'pickle', 're']  # noqa: F822 (defined lazily by __getattr__)
@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from typing import ClassVar, Dict, Set, Union
+from typing import ClassVar, Dict, Optional, Set, Tuple, Union
 
 from records.fillers import AssertCallValidation, CallCoercion, CallValidation
 from records.fillers.filler import Filler
-from records.fillers.get_filler import get_filler
+from records.fillers.get_filler import get_annotated_filler
 from records.tags import Tag
-from records.utils.decorators import decorator_kw_method
 from records.utils.typing_compatible import get_args, get_origin, split_annotation
 
 try:
@@ -22,15 +21,39 @@ class Factory:
     """
     A function wrapper to specify that a default value should be treated as a factory method
     """
+    __slots__ = 'func',
 
     def __init__(self, func):
         self.func = func
 
 
+def _make_adder(token_cls, name: str, doc: str):
+    """
+    create a method of `RecordField` that wraps a callable in a token and applies it to the field's filler
+    :param token_cls: the token class to wrap callables in
+    :param name: the name of the method
+    :param doc: the docstring of the method
+    :return: the method, to be used either as a decorator or as a decorator factory
+    """
+
+    def ret(self, func=None, sub_key=None, **kwargs):
+        if func is None:
+            # called with keyword arguments only, to be used as a decorator
+            return lambda f: ret(self, f, sub_key, **kwargs)
+        self._apply_to_filler(token_cls(func, **kwargs), sub_filler_key=sub_key)
+        return func
+
+    ret.__name__ = name
+    ret.__qualname__ = 'RecordField.' + name
+    ret.__doc__ = doc
+    return ret
+
+
 class RecordField:
     """
     A singular field in a record, each field is owned by a single RecordBase subclass
     """
+    __slots__ = 'filler', 'name', 'default', 'default_is_factory', 'owner', 'tags'
 
     def __init__(self, *, filler: Filler, owner, name: str, default):
         """
@@ -89,11 +112,13 @@ class RecordField:
         .. note::
             currently, fields with a factory default always return ``False`` for this method, this is subject to change
         """
-        return (not self.default_is_factory) and self.default == v
+        # an identity check avoids a (possibly deep) equality check for the common case of an unchanged default
+        return (not self.default_is_factory) and (v is self.default or self.default == v)
 
     @classmethod
     def _apply_factory(cls, default):
-        if isinstance(default, Factory):
+        # an exact type check covers the common case, isinstance is only needed for subclasses of Factory
+        if type(default) is Factory or isinstance(default, Factory):
             return default.func, True
         return default, False
 
@@ -110,16 +135,18 @@ class RecordField:
         """
         if th is Final:
             raise TypeError('raw Final cannot be use inside records')
+        # fields are never reused between owners, since their fillers are mutated by pre_bind and bound to the owner,
+        # instead, the decomposition of the hint and the resolution of its filler class are cached
         origin, args = split_annotation(th)
         meta_org = get_origin(origin)
-        if meta_org == ClassVar:
+        if meta_org is ClassVar:
             return SKIP_FIELD
         if meta_org is Final:
             if not owner.is_frozen():
                 raise TypeError('cannot declare Final field in non-frozen Record')
             ret = cls.from_type_hint(get_args(origin)[0], owner=owner, **kwargs)
         else:
-            filler = get_filler(th)
+            filler = get_annotated_filler(origin, args)
             ret = cls(filler=filler, owner=owner, **kwargs)
         for arg in args:
             ret._apply(arg)
@@ -129,9 +156,7 @@ class RecordField:
         target_filler = self.filler.sub_filler(sub_filler_key)
         target_filler.apply(token)
 
-    @decorator_kw_method
-    def add_validator(self, func, sub_key=None, **kwargs):
-        """
+    add_validator = _make_adder(CallValidation, 'add_validator', """
         add a ``CallValidation`` to the field's filler.
 
         :param func: the callable to wrap inside the ``CallValidation``
@@ -155,13 +180,9 @@ class RecordField:
                     @cls.x.add_validator(a=0)
                     def validator1(a):
                         ...
-        """
-        self._apply_to_filler(CallValidation(func, **kwargs), sub_filler_key=sub_key)
-        return func
+        """)
 
-    @decorator_kw_method
-    def add_assert_validator(self, func, sub_key=None, **kwargs):
-        """
+    add_assert_validator = _make_adder(AssertCallValidation, 'add_assert_validator', """
         add a ``AssertCallValidation`` to the field's filler.
 
         :param func: the callable to wrap inside the ``AssertCallValidation``
@@ -185,13 +206,9 @@ class RecordField:
                     @cls.x.add_assert_validator(warn=True)
                     def validator1():
                         ...
-        """
-        self._apply_to_filler(AssertCallValidation(func, **kwargs), sub_filler_key=sub_key)
-        return func
+        """)
 
-    @decorator_kw_method
-    def add_coercer(self, func, sub_key=None, **kwargs):
-        """
+    add_coercer = _make_adder(CallCoercion, 'add_coercer', """
         add a ``CallCoercion`` to the field's filler.
 
         :param func: the callable to wrap inside the ``CallCoercion``
@@ -215,9 +232,7 @@ class RecordField:
                     @cls.x.add_coercer(a=15)
                     def coercion1(a):
                         ...
-        """
-        self._apply_to_filler(CallCoercion(func, **kwargs), sub_filler_key=sub_key)
-        return func
+        """)
 
     def _apply(self, token):
         if isinstance(token, Tag):
@@ -229,6 +244,65 @@ class FieldDict(Dict[str, RecordField]):
     A mapping from names to fields
     """
 
+    _items_tuple: Optional[Tuple[Tuple[str, RecordField], ...]] = None
+    _tag_index: Optional[Dict[Tag, FieldDict]] = None
+
+    @property
+    def items_tuple(self) -> Tuple[Tuple[str, RecordField], ...]:
+        """
+        :return: a tuple of all the name-field pairs in the mapping, in order.
+
+        .. note::
+            the tuple is cached until the mapping is mutated, making it cheaper than ``items()`` for repeated ordered
+            traversal.
+        """
+        if self._items_tuple is None:
+            self._items_tuple = tuple(self.items())
+        return self._items_tuple
+
+    def _mutated(self):
+        """
+        invalidate all cached data of the mapping
+        """
+        self._items_tuple = None
+        self._tag_index = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._mutated()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._mutated()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._mutated()
+
+    def setdefault(self, key, default=None):
+        ret = super().setdefault(key, default)
+        self._mutated()
+        return ret
+
+    def pop(self, *args):
+        ret = super().pop(*args)
+        self._mutated()
+        return ret
+
+    def popitem(self):
+        ret = super().popitem()
+        self._mutated()
+        return ret
+
+    def clear(self):
+        super().clear()
+        self._mutated()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._mutated()
+        return self
+
     def filter_by_tag(self, tag: Tag):
         """
         Filter the fields in the mapping to only those that have a tag
@@ -236,4 +310,12 @@ class FieldDict(Dict[str, RecordField]):
         :param tag: the tag to include
         :return: a new :py:class:`FieldDict` including only the fields that possess ``tag``
         """
-        return FieldDict((k, f) for (k, f) in self.items() if (tag in f.tags))
+        if self._tag_index is None:
+            # index all the tags at once, so that subsequent calls need not scan the fields
+            tag_index = {}
+            for k, f in self.items_tuple:
+                for t in f.tags:
+                    tag_index.setdefault(t, FieldDict())[k] = f
+            self._tag_index = tag_index
+        # the indexed mapping is copied (a C-level dict copy) so that callers cannot mutate the index
+        return FieldDict(self._tag_index.get(tag, ()))
@@ -7,6 +7,15 @@ builtin_filler_map: Dict[Any, Type[AnnotatedFiller]] = {}
 """
 a mapping of origin types to builtin filler types. If an exact match is not found in the map,
  then the checkers below are called, if none of them match, the mapping is checked again for subclassing.
+
+.. note::
+    The filler type resolved for each origin is cached, if this mapping, or the ones below, are changed after fillers
+    have been created, `records.fillers.get_filler.clear_filler_type_cache` must be called.
+"""
+builtin_filler_identity_map: Dict[Any, Union[Type[AnnotatedFiller], GetFiller]] = {}
+"""
+a mapping of special storage type objects (that are not types) to builtin filler types or redirections. Checked before
+ the checkers below, as a cheaper alternative to a checker that only compares the storage type to a single object.
 """
 builtin_filler_checkers: List[Callable[[Any], Union[None, GetFiller, Type[AnnotatedFiller]]]] = []
 """
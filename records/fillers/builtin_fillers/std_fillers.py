@@ -1,10 +1,10 @@
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod, get_cache_token
 from ast import literal_eval
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from inspect import isabstract
 from math import isclose
 from numbers import Complex, Rational, Real, Integral
-from typing import Any, Callable, Dict, Generic, Type, TypeVar, Union, Tuple, Optional
+from typing import Any, Callable, Dict, FrozenSet, Generic, Type, TypeVar, Union, Tuple, Optional
 
 from records.fillers.builtin_fillers.recurse import GetFiller
 from records.fillers.coercers import CoercionToken, GlobalCoercionToken
@@ -12,6 +12,25 @@ from records.fillers.filler import AnnotatedFiller, TypeCheckStyle, TypeMatch
 
 T = TypeVar('T')
 
+_MISSING = object()
+
+# the type match members are bound to module constants, to avoid looking them up on the enum in type checks
+_EXACT = TypeMatch.exact
+_INEXACT = TypeMatch.inexact
+
+_TPFLAGS_BASETYPE = 1 << 10
+"""
+the flag in a type's ``__flags__`` that is set if the type can be subclassed
+"""
+
+
+@lru_cache(maxsize=1024)
+def _compile_eval(source: str):
+    """
+    compile an expression for `Eval`, caching the result for inputs that repeat
+    """
+    return compile(source, '<Eval>', 'eval')
+
 
 class Eval(GlobalCoercionToken):
     """
@@ -40,12 +59,15 @@ class Eval(GlobalCoercionToken):
         ns = self.kwargs
         if self.add_bound:
             ns = {**self.kwargs, origin.__name__: origin}
+        eval_globals = {'__builtins__': ns}
 
         def ret(v):
             if not isinstance(v, str):
                 raise TypeError
             try:
-                ret = eval(v, {'__builtins__': ns})
+                # names assigned during evaluation are stored in a copy of the globals, so evaluations can't affect
+                # one another. A separate locals dict would hide those names from nested scopes.
+                ret = eval(_compile_eval(v), dict(eval_globals))
             except Exception as e:
                 raise TypeError from e
 
@@ -54,21 +76,43 @@ class Eval(GlobalCoercionToken):
         return ret
 
 
+_LITERAL_EVAL_ORIGINS: FrozenSet[type] = frozenset((int, str, float, complex, set, tuple, dict, list, bool))
+"""
+the origin types that `LiteralEval` can be used for
+"""
+
+
 class LiteralEval(GlobalCoercionToken):
     """
     A coercion token to evaluate string inputs with :py:func:`literal_eval`
+
+    .. note::
+        Inputs are evaluated once, a string that evaluates to another string is not evaluated again, and is rejected.
     """
 
     def __call__(self, origin, filler):
-        if origin not in {int, str, float, complex, set, tuple, dict, list, bool}:
+        if origin not in _LITERAL_EVAL_ORIGINS:
             raise TypeError(f'cannot use literal evaluation coercer with non-literal type {origin}')
 
+        if origin is str:
+            # the coercer is only called for values that failed type checking, and evaluating a string can never
+            # produce a better string, so there is nothing to coerce
+            def ret(v):
+                if isinstance(v, str):
+                    return v
+                raise TypeError
+
+            return ret
+
         def ret(v):
-            while isinstance(v, str):
-                try:
-                    v = literal_eval(v)
-                except ValueError:
-                    raise TypeError
+            if not isinstance(v, str):
+                return v
+            try:
+                v = literal_eval(v)
+            except ValueError:
+                raise TypeError
+            if isinstance(v, str):
+                raise TypeError('literal evaluation resulted in a string')
             return v
 
         return ret
@@ -98,8 +142,25 @@ class OriginDependant(GlobalCoercionToken, ABC):
         """
         pass
 
+    def coercer(self, origin) -> Callable[[Any], Any]:
+        """
+        Create the coercion callback for an origin.
+        :param origin: The target storage type.
+        :return: A callback that coerces a single input argument.
+        .. note::
+            By default, the callback forwards to `func_args`. Subclasses may override this method to return
+            callbacks specialized for their arguments.
+        """
+        # the method is bound once, here, rather than looked up for every value
+        func_args = self.func_args
+
+        def ret(v):
+            return func_args(origin, v)
+
+        return ret
+
     def __call__(self, origin, filler):
-        return partial(self.func_args, origin)
+        return self.coercer(origin)
 
 
 class LooseMixin(OriginDependant, ABC):
@@ -124,10 +185,37 @@ class Loose(LooseMixin):
         self._type_constraint: Union[None, type, Tuple[type, ...]] = None
 
     def func_args(self, origin, v):
-        if self._type_constraint and not isinstance(v, self._type_constraint):
-            raise TypeError(f'must be of type {self._type_constraint}')
         return origin(v, *self.args, **self.kwargs)
 
+    def coercer(self, origin):
+        if type(self).func_args is not Loose.func_args:
+            return super().coercer(origin)
+        args = self.args
+        kwargs = self.kwargs
+        if args:
+            def ret(v):
+                return origin(v, *args, **kwargs)
+
+            return ret
+        if kwargs:
+            return partial(origin, **kwargs)
+        # the constructor itself is the coercer
+        return origin
+
+    def __call__(self, origin, filler):
+        ret = super().__call__(origin, filler)
+        # the constraint is resolved once here, so unconstrained tokens don't check it for every value
+        type_constraint = self._type_constraint
+        if type_constraint:
+            unconstrained = ret
+
+            def ret(v):
+                if not isinstance(v, type_constraint):
+                    raise TypeError(f'must be of type {type_constraint}')
+                return unconstrained(v)
+
+        return ret
+
     @classmethod
     def constrain(cls, item: Union[type, Tuple[type, ...]]):
         """
@@ -161,17 +249,46 @@ class LooseUnpack(LooseMixin):
                                       Tuple[Union[type, Tuple[type, ...]], type(...)]] = None
 
     def func_args(self, origin, v):
-        if self._type_constraints is not None:
-            v = tuple(v)
-            if len(self._type_constraints) == 2 and self._type_constraints[1] is ...:
-                if any(not isinstance(i, self._type_constraints[0]) for i in v):
-                    raise TypeError(f'all arguments must be instances of {self._type_constraints[0]}')
-            else:
-                if len(v) != len(self._type_constraints) \
-                        or any(not isinstance(i, tc) for (i, tc) in zip(v, self._type_constraints)):
-                    raise TypeError
         return origin(*v, *self.args, **self.kwargs)
 
+    def coercer(self, origin):
+        if type(self).func_args is not LooseUnpack.func_args:
+            return super().coercer(origin)
+        args = self.args
+        kwargs = self.kwargs
+        if args or kwargs:
+            def ret(v):
+                return origin(*v, *args, **kwargs)
+        else:
+            def ret(v):
+                return origin(*v)
+
+        return ret
+
+    def __call__(self, origin, filler):
+        unconstrained = super().__call__(origin, filler)
+        # the kind of constraint is resolved once here, rather than for every value
+        type_constraints = self._type_constraints
+        if type_constraints is None:
+            return unconstrained
+        if len(type_constraints) == 2 and type_constraints[1] is ...:
+            element_constraint = type_constraints[0]
+
+            def ret(v):
+                v = tuple(v)
+                if any(not isinstance(i, element_constraint) for i in v):
+                    raise TypeError(f'all arguments must be instances of {element_constraint}')
+                return unconstrained(v)
+        else:
+            def ret(v):
+                v = tuple(v)
+                if len(v) != len(type_constraints) \
+                        or any(not isinstance(i, tc) for (i, tc) in zip(v, type_constraints)):
+                    raise TypeError
+                return unconstrained(v)
+
+        return ret
+
     @classmethod
     def constrain(cls, *items: Union[type, Tuple[type, ...], type(...)]):
         """
@@ -209,12 +326,37 @@ class LooseUnpackMap(LooseMixin):
         self._type_constraints: Optional[Dict[str, Union[type, Tuple[type, ...]]]] = None
 
     def func_args(self, origin, v):
-        if self._type_constraints is not None:
+        return origin(*self.args, **v, **self.kwargs)
+
+    def coercer(self, origin):
+        if type(self).func_args is not LooseUnpackMap.func_args:
+            return super().coercer(origin)
+        args = self.args
+        kwargs = self.kwargs
+        if args or kwargs:
+            def ret(v):
+                return origin(*args, **v, **kwargs)
+        else:
+            def ret(v):
+                return origin(**v)
+
+        return ret
+
+    def __call__(self, origin, filler):
+        unconstrained = super().__call__(origin, filler)
+        # the constraint is resolved once here, so unconstrained tokens don't check it for every value
+        type_constraints = self._type_constraints
+        if type_constraints is None:
+            return unconstrained
+
+        def ret(v):
             for k, a in v.items():
-                tc = self._type_constraints.get(k)
+                tc = type_constraints.get(k)
                 if tc is None or not isinstance(a, tc):
                     raise TypeError
-        return origin(*self.args, **v, **self.kwargs)
+            return unconstrained(v)
+
+        return ret
 
     @classmethod
     def constrain(cls, **items: Union[type, Tuple[type, ...]]):
@@ -241,36 +383,141 @@ class SimpleFiller(AnnotatedFiller[T], Generic[T]):
     A concrete filler class that uses instance checking to check types
     """
 
-    def type_check(self, v):
+    def __init__(self, origin, args):
+        super().__init__(origin, args)
+        if type(origin).__instancecheck__ is ABCMeta.__instancecheck__:
+            # instance checks of ABCs are expensive, but only depend on the type of the value, so their results can be
+            # cached by type. Instance checks of concrete classes are cheaper than a cache lookup.
+            self._type_check_cache: Optional[Dict[type, Optional[TypeMatch]]] = {}
+        else:
+            self._type_check_cache = None
+        self._type_check_cache_token = get_cache_token()
+        if (not getattr(origin, '__flags__', _TPFLAGS_BASETYPE) & _TPFLAGS_BASETYPE) \
+                and type(self).type_check is SimpleFiller.type_check:
+            # the origin cannot be subclassed, so only values of the exact type can match it
+            self.type_check = self._final_type_check
+
+    def _final_type_check(self, v):
+        """
+        The implementation of `type_check` for origins that cannot be subclassed
+        """
+        t = type(v)
+        if t is self.origin:
+            return _EXACT
+        if v.__class__ is not t:
+            # the value might pretend to be of the origin type
+            return _INEXACT if isinstance(v, self.origin) else None
+        return None
+
+    def _type_check(self, v):
+        """
+        The uncached implementation of `type_check`
+        """
         if type(v) == self.origin:
-            return TypeMatch.exact
-        return TypeMatch.inexact if isinstance(v, self.origin) else None
+            return _EXACT
+        return _INEXACT if isinstance(v, self.origin) else None
+
+    def type_check(self, v):
+        cache = self._type_check_cache
+        if cache is None:
+            if type(v) is self.origin:
+                return _EXACT
+            return _INEXACT if isinstance(v, self.origin) else None
+        token = get_cache_token()
+        if token != self._type_check_cache_token:
+            # a class has been registered to an ABC, so cached results might be outdated
+            cache.clear()
+            self._type_check_cache_token = token
+        t = type(v)
+        if v.__class__ is not t:
+            # isinstance also checks __class__, which proxies can override per instance, so the type is not enough
+            return self._type_check(v)
+        ret = cache.get(t, _MISSING)
+        if ret is _MISSING:
+            ret = cache[t] = self._type_check(v)
+        return ret
 
     def bind(self, owner_cls):
         super().bind(owner_cls)
+        if self._type_check_cache is not None:
+            self._type_check_cache.clear()
 
         if self.type_checking_style == TypeCheckStyle.check_strict and isabstract(self.origin):
             raise TypeError(f'cannot create strict checker for abstract class {self.origin}')
 
 
+def _whole_int(v):
+    return v
+
+
+def _whole_float(v):
+    mod = v % 1
+    if isclose(mod, 0) or isclose(mod, 1):
+        return v
+    raise TypeError
+
+
+def _whole_complex(v):
+    if v.imag == 0:
+        return _whole_float(v.real)
+    raise TypeError
+
+
+_WHOLE_DISPATCH: Dict[type, Callable[[Any], Any]] = {
+    int: _whole_int,
+    float: _whole_float,
+    complex: _whole_complex,
+}
+"""
+handlers of `Whole.whole_value` for common numeric types, to avoid checking them against the numeric ABCs
+"""
+
+
 class Whole(OriginDependant):
     """
     A coercion token to attempt to convert a whole Number to an Integer type
     """
 
-    def func_args(self, origin, v):
+    @staticmethod
+    def whole_value(v):
+        """
+        :param v: A number.
+        :return: The value to pass to the target type's constructor, if ``v`` is whole.
+        :raises TypeError: If ``v`` is not a whole number.
+        """
+        handler = _WHOLE_DISPATCH.get(type(v))
+        if handler is not None:
+            return handler(v)
         if isinstance(v, Rational):
             if v.denominator == 1:
-                return origin(v.numerator, *self.args, **self.kwargs)
+                return v.numerator
         elif isinstance(v, Real):
             mod = v % 1
             if isclose(mod, 0) or isclose(mod, 1):
-                return origin(v, *self.args, **self.kwargs)
+                return v
         elif isinstance(v, Complex):
             if v.imag == 0:
-                return self.func_args(origin, v.real)
+                return Whole.whole_value(v.real)
         raise TypeError
 
+    def func_args(self, origin, v):
+        return origin(self.whole_value(v), *self.args, **self.kwargs)
+
+    def coercer(self, origin):
+        if type(self).func_args is not Whole.func_args:
+            return super().coercer(origin)
+        whole_value = self.whole_value
+        args = self.args
+        kwargs = self.kwargs
+        if args or kwargs:
+            def ret(v):
+                return origin(whole_value(v), *args, **kwargs)
+        else:
+            def ret(v):
+                return origin(whole_value(v))
+
+        return ret
+
 
 class ToBytes(OriginDependant):
     """
@@ -327,14 +574,26 @@ class Falsish(OriginDependant):
             return origin(*self.args, **self.kwargs)
         raise TypeError
 
+    def coercer(self, origin):
+        if self.args or self.kwargs or type(self).func_args is not Falsish.func_args:
+            return super().coercer(origin)
+
+        def ret(v):
+            if not v:
+                return origin()
+            raise TypeError
+
+        return ret
+
 
 class NoneFiller(SimpleFiller[None]):
     """
     A specialized filler for None
     """
 
-    def type_check(self, v) -> bool:
-        return (v is None) and TypeMatch.exact
+    @staticmethod
+    def type_check(v) -> Optional[TypeMatch]:
+        return _EXACT if v is None else None
 
 
 class EllipsisFiller(SimpleFiller[type(...)]):
@@ -342,8 +601,9 @@ class EllipsisFiller(SimpleFiller[type(...)]):
     A specialized filler for Ellipsis
     """
 
-    def type_check(self, v) -> bool:
-        return (v is ...) and TypeMatch.exact
+    @staticmethod
+    def type_check(v) -> Optional[TypeMatch]:
+        return _EXACT if v is ... else None
 
 
 class CallableFiller(AnnotatedFiller[Callable]):
@@ -351,8 +611,9 @@ class CallableFiller(AnnotatedFiller[Callable]):
     A specialized filler for callable objects
     """
 
-    def type_check(self, v):
-        return callable(v) and TypeMatch.exact
+    @staticmethod
+    def type_check(v) -> Optional[TypeMatch]:
+        return _EXACT if callable(v) else None
 
 
 std_filler_map: Dict[Any, Type[AnnotatedFiller]] = {
@@ -362,16 +623,9 @@ std_filler_map: Dict[Any, Type[AnnotatedFiller]] = {
     type(...): EllipsisFiller
 }
 
-std_filler_checkers = []
-
-
-@std_filler_checkers.append
-def callable_checker(stored_type):
-    if stored_type is callable:
-        return CallableFiller
-
+std_filler_identity_map: Dict[Any, Union[Type[AnnotatedFiller], GetFiller]] = {
+    callable: CallableFiller,
+    None: GetFiller(type(None)),
+}
 
-@std_filler_checkers.append
-def none_checker(stored_type):
-    if stored_type is None:
-        return GetFiller(type(None))
+std_filler_checkers = []
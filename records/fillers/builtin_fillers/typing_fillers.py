@@ -4,19 +4,34 @@ import collections.abc as abstract_collections
 import contextlib
 from collections import defaultdict, deque
 from collections.abc import Callable as CallableBase
-from itertools import chain, islice
-from typing import Any, Sequence, TypeVar, Union
+from itertools import islice
+from operator import itemgetter
+from sys import intern
+from typing import Any, Dict, FrozenSet, Optional, Sequence, TypeVar, Union
 
 from records.fillers.builtin_fillers.recurse import GetFiller
+from records.fillers.builtin_fillers.std_fillers import EllipsisFiller, NoneFiller, SimpleFiller
 from records.fillers.filler import (AnnotatedFiller, Filler, TypeMatch, FillingSuccess, TypePassKind)
 from records.fillers.get_filler import get_annotated_filler, get_filler
-from records.utils.typing_compatible import get_args, get_origin
+from records.utils.codegen import compile_function
+from records.utils.decorators import identity_cache
+from records.utils.typing_compatible import get_args, get_origin, split_union
 
 try:
     from typing import Literal
 except ImportError:
     Literal = object()
 
+try:
+    from types import UnionType
+except ImportError:
+    UnionType = object()
+
+_TYPE_EXACT_CHECKS = (SimpleFiller.type_check, NoneFiller.type_check, EllipsisFiller.type_check)
+"""
+type checking implementations that report an exact match if and only if the type of the value is the filler's origin
+"""
+
 
 class UnionFiller(Filler):
     """
@@ -27,8 +42,12 @@ class UnionFiller(Filler):
         super().__init__()
         self.args = args
         self.sub_types = get_args(origin)
-        self.sub_fillers: Sequence[Filler] = tuple(get_filler(a) for a in self.sub_types)
+        self.sub_fillers: Sequence[Filler] = tuple(get_annotated_filler(o, a) for (o, a) in split_union(origin))
         self.applied = []
+        # a mapping of types to the only sub-filler that can strictly match values of that type, if known
+        self._strict_fillers: Dict[type, Filler] = {}
+        # whether all the sub-fillers are hollow, known only after binding
+        self._hollow: Optional[bool] = None
 
     def apply(self, token):
         super().apply(token)
@@ -49,14 +68,45 @@ class UnionFiller(Filler):
         """
         if self.is_hollow():
             return FillingSuccess(arg, TypePassKind.hollow)
+        sub_fillers = self.sub_fillers
+        last_filler = sub_fillers[-1]
+        # the error of the last sub-filler, which is raised if no sub-filler succeeds
+        last_error = None
+        strict_filler = self._strict_fillers.get(type(arg))
+        if strict_filler is not None:
+            # only this sub-filler can match strictly, so if it succeeds, no other sub-filler can beat it
+            try:
+                return strict_filler.fill(arg)
+            except Exception as e:
+                # fall back to the full process, since other sub-fillers might coerce the argument
+                if strict_filler is last_filler:
+                    last_error = e
+
+        # we only fill the sub-fillers that might match, from the best possible match to the worst, until no remaining
+        # sub-filler can match as well as the best one so far
+        candidates = []
+        for i, sub_filler in enumerate(sub_fillers):
+            if sub_filler is strict_filler:
+                # already failed
+                continue
+            try:
+                bound = sub_filler.match(arg)
+            except Exception:
+                # the sub-filler's type checking failed, we can't rule it out, so it might match as well as any other
+                bound = TypePassKind.no_coerce_strict
+            if bound is not None:
+                candidates.append((bound, i, sub_filler))
+        candidates.sort(key=itemgetter(0, 1))
         best_results = []
         best_key = float('inf')
-        for i, sub_filler in enumerate(self.sub_fillers):
+        for bound, _, sub_filler in candidates:
+            if bound > best_key:
+                break
             try:
                 success = sub_filler.fill(arg)
-            except Exception:
-                if not best_results and i + 1 == len(self.sub_fillers):
-                    raise
+            except Exception as e:
+                if sub_filler is last_filler:
+                    last_error = e
                 continue
             if success.type_pass_kind < best_key:
                 best_results = [success.value]
@@ -64,6 +114,12 @@ class UnionFiller(Filler):
             elif success.type_pass_kind == best_key:
                 best_results.append(success.value)
 
+        if not best_results:
+            if last_error is None:
+                # the last sub-filler was ruled out without filling, filling it now only fails its type checking
+                return last_filler.fill(arg)
+            raise last_error
+
         if len(best_results) > 1 and any(r is not best_results[0] for r in best_results[1:]):
             raise ValueError('multiple sub-fillers matched')
 
@@ -71,15 +127,40 @@ class UnionFiller(Filler):
 
     def bind(self, owner_cls):
         super().bind(owner_cls)
+        # the sub-fillers are still bound eagerly, so that invalid annotations are reported when the class is defined
+        tokens = (*self.args, *self.applied)
         for sf in self.sub_fillers:
-            for t in chain(self.args, self.applied):
+            for t in tokens:
                 sf.apply(t)
 
             sf.bind(owner_cls)
+        self._hollow = all(sf.is_hollow() for sf in self.sub_fillers)
+
+        # if all the sub-fillers match strictly only by the exact type of the value, then for every value type, at most
+        # one sub-filler can match it strictly, and we can find it directly
+        if all(getattr(type(sf), 'type_check', None) in _TYPE_EXACT_CHECKS and not sf.is_hollow()
+               for sf in self.sub_fillers):
+            origins = [sf.origin for sf in self.sub_fillers]
+            self._strict_fillers = {
+                sf.origin: sf for sf in self.sub_fillers if origins.count(sf.origin) == 1
+            }
+
+    def freeze(self):
+        super().freeze()
+        for sf in self.sub_fillers:
+            sf.freeze()
 
     def is_hollow(self) -> bool:
+        if self._hollow is not None:
+            return self._hollow
         return all(sf.is_hollow() for sf in self.sub_fillers)
 
+    def match(self, arg):
+        if self.is_hollow():
+            return TypePassKind.hollow
+        bounds = [b for b in (sf.match(arg) for sf in self.sub_fillers) if b is not None]
+        return min(bounds, default=None)
+
     def sub_filler(self, key):
         if isinstance(key, int):
             return self.sub_fillers[key]
@@ -93,22 +174,55 @@ class LiteralFiller(AnnotatedFiller):
 
     def __init__(self, origin, args):
         super().__init__(origin, args)
-        self.possible_values = defaultdict(set)
+        possible_values = defaultdict(set)
         for pv in get_args(origin):
-            self.possible_values[type(pv)].add(pv)
-
-    def type_check(self, v):
+            if type(pv) is str:
+                # interned strings compare by identity when the input is also interned (as identifiers and source
+                # constants usually are)
+                pv = intern(pv)
+            possible_values[type(pv)].add(pv)
+        self.possible_values: Dict[type, FrozenSet] = {t: frozenset(values) for t, values in possible_values.items()}
+        self._possible_types = tuple(self.possible_values)
+        if len(self._possible_types) == 1:
+            # all the values are of the same type, as is usually the case
+            self._single_type, = self._possible_types
+            self.type_check = self._single_type_check
+
+    def type_check(self, v) -> Optional[TypeMatch]:
         if type(v) in self.possible_values:
             return TypeMatch.exact
-        return isinstance(v, tuple(self.possible_values)) and TypeMatch.inexact
+        return TypeMatch.inexact if isinstance(v, self._possible_types) else None
+
+    def _single_type_check(self, v) -> Optional[TypeMatch]:
+        """
+        The implementation of `type_check` for literals whose values all share a single type
+        """
+        single_type = self._single_type
+        if type(v) is single_type:
+            return TypeMatch.exact
+        return TypeMatch.inexact if isinstance(v, single_type) else None
 
     def bind(self, owner_cls):
         super().bind(owner_cls)
 
-        if not self.is_hollow():
+        if self.is_hollow():
+            return
+        if len(self._possible_types) == 1:
+            single_type = self._single_type
+            values = self.possible_values[single_type]
+
+            @self.validators.append
+            def single_type_validator(v):
+                if type(v) is not single_type or v not in values:
+                    raise ValueError
+                return v
+        else:
+            possible_values = self.possible_values
+
             @self.validators.append
             def inner_validator(v):
-                if v not in self.possible_values[type(v)]:
+                bucket = possible_values.get(type(v))
+                if bucket is None or v not in bucket:
                     raise ValueError
                 return v
 
@@ -129,9 +243,22 @@ class WrapperFiller(Filler):
         super().bind(owner_cls)
         self.inner_filler.bind(owner_cls)
 
+    def freeze(self):
+        super().freeze()
+        self.inner_filler.freeze()
+        if type(self).fill is WrapperFiller.fill:
+            # filling is delegated as-is, so once frozen, calls can skip the wrapper entirely
+            self.fill = self.inner_filler.fill
+
     def is_hollow(self) -> bool:
         return self.inner_filler.is_hollow()
 
+    def match(self, arg):
+        if type(self).fill is not WrapperFiller.fill:
+            # the inner filler's estimation is only valid if filling is delegated as-is
+            return super().match(arg)
+        return self.inner_filler.match(arg)
+
     def apply(self, token):
         self.inner_filler.apply(token)
 
@@ -148,82 +275,31 @@ class TypeFiller(WrapperFiller):
     def bind(self, owner_cls):
         super().bind(owner_cls)
 
-        if not self.inner_filler.is_hollow():
+        base_type = self.base_type
+        # every class is a subclass of object, and Any cannot be used with issubclass
+        if not self.inner_filler.is_hollow() and base_type not in (object, Any):
+
             @self.inner_filler.validators.append
             def inner_validator(v):
-                if not issubclass(v, self.base_type):
-                    raise ValueError(f'must be a subclass of {self.base_type}')
+                if not issubclass(v, base_type):
+                    raise ValueError(f'must be a subclass of {base_type}')
                 return v
 
 
 class TupleFiller(WrapperFiller):
     """
-    A filler for a parameterized typing.Tuple
+    A base filler for a parameterized typing.Tuple
     """
 
     def __init__(self, origin, args):
         super().__init__(get_origin(origin), args)
         self.inner_args = get_args(origin)
-        if len(self.inner_args) == 2 and self.inner_args[-1] is ...:
-            self.sub_fillers = (get_filler(self.inner_args[0]),)
-        else:
-            self.sub_fillers = tuple(get_filler(t) for t in self.inner_args)
-
-    def bind(self, owner_cls):
-        super().bind(owner_cls)
+        self.sub_fillers: Sequence[Filler] = ()
 
-        if len(self.inner_args) == 2 and self.inner_args[-1] is ...:
-            inner_filler = self.sub_fillers[0]
-            inner_filler.bind(owner_cls)
-            if not inner_filler.is_hollow():
-                if self.is_hollow():
-                    raise TypeError('cannot use non-hollow inner fillers in a hollow filler')
-
-                @self.inner_filler.validators.append
-                def inner_validator(v):
-                    hollow_passes = 0  # the number of elements that filled identically
-                    for element in v:
-                        filled = inner_filler.__call__(element)
-                        if filled is element:
-                            hollow_passes += 1
-                        else:
-                            all_elements = chain(
-                                v[:hollow_passes],
-                                [filled],
-                                (inner_filler.__call__(a) for a in v[hollow_passes + 1:])
-                            )
-                            return type(v)(all_elements)
-                    return v
-        else:
-            if not self.is_hollow():
-                @self.inner_filler.validators.append
-                def _(v):
-                    if len(v) != len(self.sub_fillers):
-                        raise ValueError(f'must be a {len(self.sub_fillers)}-tuple')
-                    return v
-
-            for f in self.sub_fillers:
-                f.bind(owner_cls)
-            if not all(inner_filler.is_hollow() for inner_filler in self.sub_fillers):
-                if self.is_hollow():
-                    raise TypeError('cannot use non-hollow inner fillers in a hollow filler')
-
-                @self.inner_filler.validators.append
-                def _(v):
-                    hollow_passes = 0  # the number of elements that filled identically
-                    for element, filler in zip(v, self.sub_fillers):
-                        filled = filler(element)
-                        if filled is element:
-                            hollow_passes += 1
-                        else:
-                            all_elements = chain(
-                                v[:hollow_passes],
-                                [filled],
-                                (if_(a) for (a, if_) in zip(v[hollow_passes + 1:],
-                                                            self.sub_fillers[hollow_passes + 1:]))
-                            )
-                            return type(v)(all_elements)
-                    return v
+    def freeze(self):
+        super().freeze()
+        for f in self.sub_fillers:
+            f.freeze()
 
     def sub_filler(self, key):
         if isinstance(key, int):
@@ -231,20 +307,114 @@ class TupleFiller(WrapperFiller):
         return super().sub_filler(key)
 
 
+class VarTupleFiller(TupleFiller):
+    """
+    A filler for a variable-length parameterized typing.Tuple (``Tuple[T, ...]``)
+    """
+
+    def __init__(self, origin, args):
+        super().__init__(origin, args)
+        self.sub_fillers = (get_filler(self.inner_args[0]),)
+
+    def bind(self, owner_cls):
+        super().bind(owner_cls)
+
+        inner_filler = self.sub_fillers[0]
+        inner_filler.bind(owner_cls)
+        if not inner_filler.is_hollow():
+            if self.is_hollow():
+                raise TypeError('cannot use non-hollow inner fillers in a hollow filler')
+            fill_element = inner_filler.__call__
+
+            @self.inner_filler.validators.append
+            def inner_validator(v):
+                hollow_passes = 0  # the number of elements that filled identically
+                for element in v:
+                    filled = fill_element(element)
+                    if filled is element:
+                        hollow_passes += 1
+                    else:
+                        all_elements = list(v[:hollow_passes])
+                        all_elements.append(filled)
+                        all_elements.extend(map(fill_element, v[hollow_passes + 1:]))
+                        return type(v)(all_elements)
+                return v
+
+
+def _fixed_tuple_validator(sub_fillers: Sequence[Filler], fill_elements: bool):
+    """
+    Generate a validation callback for a fixed-length tuple.
+    :param sub_fillers: the fillers of each of the tuple's elements, in order.
+    :param fill_elements: whether to fill the tuple's elements, if false, only the tuple's length is checked.
+    :return: A callback that checks that a tuple is of the same length as `sub_fillers`, and fills each element with its
+     filler. The original tuple is returned if all the elements filled identically.
+    """
+    expected_len = len(sub_fillers)
+    lines = [
+        'def validate_tuple(v):',
+        f'    if len(v) != {expected_len}:',
+        f"        raise ValueError('must be a {expected_len}-tuple')",
+    ]
+    if fill_elements:
+        indices = range(expected_len)
+        elements = ''.join(f'e{i}, ' for i in indices)
+        filled = ', '.join(f'f{i}' for i in indices)
+        lines.append(f'    {elements}= v')
+        lines.extend(f'    f{i} = filler_{i}(e{i})' for i in indices)
+        lines.extend((
+            f"    if {' and '.join(f'f{i} is e{i}' for i in indices)}:",
+            '        return v',
+            f'    return type(v)([{filled}])',
+        ))
+    else:
+        lines.append('    return v')
+    namespace = {f'filler_{i}': f for i, f in enumerate(sub_fillers)}
+    return compile_function('\n'.join(lines), 'validate_tuple', namespace)
+
+
+class FixedTupleFiller(TupleFiller):
+    """
+    A filler for a fixed-length parameterized typing.Tuple
+    """
+
+    def __init__(self, origin, args):
+        super().__init__(origin, args)
+        self.sub_fillers = tuple(get_filler(t) for t in self.inner_args)
+
+    def bind(self, owner_cls):
+        super().bind(owner_cls)
+
+        sub_fillers = self.sub_fillers
+        for f in sub_fillers:
+            f.bind(owner_cls)
+        fill_elements = not all(inner_filler.is_hollow() for inner_filler in sub_fillers)
+        if self.is_hollow():
+            if fill_elements:
+                raise TypeError('cannot use non-hollow inner fillers in a hollow filler')
+        else:
+            self.inner_filler.validators.append(_fixed_tuple_validator(sub_fillers, fill_elements))
+
+
+_SLICEABLE_TYPES = frozenset((list, tuple, str, bytes))
+
+
 def _split_at(seq, ignore_ind):
     """
     A utility function to split it in index, ignoring the element at the selected index
     :param seq: the sequence or iterable to split
     :param ignore_ind: the index to ignore
-    :return: two iterables, one for `seq`'s elements up to `ignore_ind`, the second for all elements after.
-    .. note::
-        When used, the first iterable must be consumed entirely prior to the second one being consumed at all.
+    :return: two sequences, one for `seq`'s elements up to `ignore_ind`, the second for all elements after.
     """
-    try:
+    if type(seq) in _SLICEABLE_TYPES:
         return seq[:ignore_ind], seq[ignore_ind + 1:]
-    except TypeError:
-        i = iter(seq)
-        return islice(i, ignore_ind), islice(i, 1, None)
+    if hasattr(type(seq), '__getitem__'):
+        # the sequence might still not support slicing
+        try:
+            return seq[:ignore_ind], seq[ignore_ind + 1:]
+        except TypeError:
+            pass
+    seq = tuple(seq)
+    return seq[:ignore_ind], seq[ignore_ind + 1:]
 
 
 class GenericIterableFiller(WrapperFiller):
@@ -264,6 +434,9 @@ class GenericIterableFiller(WrapperFiller):
         :param initial: The original filled argument. Must not be mutated.
         :return: A new instance of `initial`'s type, with `elements` as its elements.
         """
+        if type(initial) is list and type(elements) is list:
+            # the elements are already a new list, there's no need to copy them
+            return elements
         return type(initial)(elements)
 
     def bind(self, owner_cls):
@@ -273,24 +446,28 @@ class GenericIterableFiller(WrapperFiller):
         if not self.element_filler.is_hollow():
             if self.is_hollow():
                 raise TypeError('cannot use non-hollow inner fillers in a hollow filler')
+            fill_element = self.element_filler.__call__
+            reconstruct = self.reconstruct
 
             @self.inner_filler.validators.append
             def inner_validator(v):
                 hollow_passes = 0  # the number of elements that filled identically
                 for element in v:
-                    filled = self.element_filler(element)
+                    filled = fill_element(element)
                     if filled is element:
                         hollow_passes += 1
                     else:
                         pre, post = _split_at(v, hollow_passes)
-                        all_elements = chain(
-                            pre,
-                            [filled],
-                            (self.element_filler(a) for a in post)
-                        )
-                        return self.reconstruct(all_elements, v)
+                        all_elements = list(pre)
+                        all_elements.append(filled)
+                        all_elements.extend(map(fill_element, post))
+                        return reconstruct(all_elements, v)
                 return v
 
+    def freeze(self):
+        super().freeze()
+        self.element_filler.freeze()
+
     def sub_filler(self, key):
         if key == 0:
             return self.element_filler
@@ -334,21 +511,32 @@ class GenericMappingFiller(WrapperFiller):
             if self.is_hollow():
                 raise TypeError('cannot use non-hollow inner fillers in a hollow filler')
 
+            key_filler = self.key_filler.__call__
+            value_filler = self.value_filler.__call__
+            reconstruct = self.reconstruct
+
             @self.inner_filler.validators.append
             def inner_validator(value):
-                # there are no shortcuts here since maps can't be slices
-                # (and thus this conversion would always require O(n) space)
-                tuples = [
-                    (self.key_filler(k), self.value_filler(v))
-                    for k, v in value.items()
-                ]
-                if any(
-                        (k is not filled_k) or (v is not filled_v)
-                        for ((k, v), (filled_k, filled_v)) in zip(value.items(), tuples)
-                ):
-                    return self.reconstruct(tuples, value)
-                else:
-                    return value
+                hollow_passes = 0  # the number of items that filled identically
+                items = iter(value.items())
+                for k, v in items:
+                    filled_k = key_filler(k)
+                    filled_v = value_filler(v)
+                    if (k is not filled_k) or (v is not filled_v):
+                        # only now do we need to store the items, maps can't be sliced so we re-iterate the prefix
+                        tuples = list(islice(value.items(), hollow_passes))
+                        tuples.append((filled_k, filled_v))
+                        append = tuples.append
+                        for k, v in items:
+                            append((key_filler(k), value_filler(v)))
+                        return reconstruct(tuples, value)
+                    hollow_passes += 1
+                return value
+
+    def freeze(self):
+        super().freeze()
+        self.key_filler.freeze()
+        self.value_filler.freeze()
 
     def sub_filler(self, key):
         if key == 0:
@@ -386,10 +574,13 @@ class GenericFillerN(WrapperFiller):
                 raise TypeError('A non-specialized filler cannot have non-hollow inner types')
 
 
+typing_identity_map = {
+    Any: GetFiller(object),
+}
+
 typing_checkers = []
 
 genric_origin_map = {
-    tuple: TupleFiller,
     type: TypeFiller,
 
     deque: GenericDequeFiller, defaultdict: DefaultDictFiller,
@@ -411,34 +602,67 @@ genric_origin_map = {
 }
 
 
+@identity_cache()
 def has_args(v):
     args = get_args(v)
     return args and any(not isinstance(a, TypeVar) for a in args)
 
 
+def _type_origin(stored_type):
+    if has_args(stored_type):
+        return TypeFiller
+    return GetFiller(type)
+
+
+def _tuple_origin(stored_type):
+    if not has_args(stored_type):
+        return GetFiller(tuple)
+    args = get_args(stored_type)
+    if len(args) == 2 and args[-1] is ...:
+        return VarTupleFiller
+    return FixedTupleFiller
+
+
+def _generic_origin_handler(origin_cls, filler_cls):
+    """
+    create a handler for a generic origin
+    :param origin_cls: the origin of the generic storage type
+    :param filler_cls: the filler class to use for the generic storage type if it has arguments
+    :return: a handler for `origin_handlers`
+    """
+
+    def ret(stored_type):
+        if has_args(stored_type):
+            return filler_cls
+        return GetFiller(origin_cls)
+
+    return ret
+
+
+origin_handlers = {
+    **{k: _generic_origin_handler(k, v) for (k, v) in genric_origin_map.items()},
+
+    tuple: _tuple_origin,
+    Union: lambda stored_type: UnionFiller,
+    UnionType: lambda stored_type: UnionFiller,
+    Literal: lambda stored_type: LiteralFiller,
+    type: _type_origin,
+    CallableBase: lambda stored_type: GetFiller(callable),
+}
+"""
+a mapping of typing origins to callbacks that accept the storage type and return its filler type or redirection
+"""
+
+
 @typing_checkers.append
 def _typing(stored_type):
     supertype = getattr(stored_type, '__supertype__', None)  # handle newtype
     if supertype:
         return GetFiller(supertype)
 
-    if stored_type is Any:
-        return GetFiller(object)
-
     origin_cls = get_origin(stored_type)
-    if origin_cls == Union:
-        return UnionFiller
-    if origin_cls == Literal:
-        return LiteralFiller
-    if origin_cls == type:
-        if has_args(stored_type):
-            return TypeFiller
-        return GetFiller(type)
-    if origin_cls == CallableBase:
-        return GetFiller(callable)
-    if has_args(stored_type):
-        t = genric_origin_map.get(origin_cls)
-        if t:
-            return t
-    elif origin_cls:
+    handler = origin_handlers.get(origin_cls)
+    if handler is not None:
+        return handler(stored_type)
+    if origin_cls and not has_args(stored_type):
         return GetFiller(origin_cls)
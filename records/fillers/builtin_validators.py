@@ -2,6 +2,7 @@ from typing import Any, Pattern, Union
 
 import records.extras as extras
 from records.fillers.validators import AssertValidation, GlobalValidationToken
+from records.utils.codegen import compile_function
 
 
 class _Least:
@@ -49,6 +50,7 @@ class Clamp(GlobalValidationToken):
     A validator class that constrains the value to be between two bounds, bringing it to the nearest bound if it
      falls outside.
     """
+    __slots__ = 'ge', 'le'
 
     def __init__(self, ge: Any = least, le: Any = greatest, **kwargs):
         """
@@ -65,7 +67,18 @@ class Clamp(GlobalValidationToken):
         return min(max(v, self.ge), self.le)
 
     def __call__(self, *_):
-        return self.inner
+        if type(self).inner is not Clamp.inner:
+            return self.inner
+        ge = self.ge
+        le = self.le
+
+        def ret(v):
+            # equivalent to min(max(v, ge), le), with the same comparisons, but without the calls
+            if ge > v:
+                v = ge
+            return le if le < v else v
+
+        return ret
 
 
 class Cyclic(GlobalValidationToken):
@@ -73,6 +86,7 @@ class Cyclic(GlobalValidationToken):
    A validator class that constrains the value to be between two bounds, bringing it to the equivalent position as
     though the domain is cyclic. Useful for angles and time of day.
    """
+    __slots__ = 'minimum', 'maximum'
 
     def __init__(self, minimum, maximum, **kwargs):
         """
@@ -91,13 +105,25 @@ class Cyclic(GlobalValidationToken):
         return self.minimum + d
 
     def __call__(self, *_):
-        return self.inner
+        if type(self).inner is not Cyclic.inner:
+            return self.inner
+        minimum = self.minimum
+        maximum = self.maximum
+        span = maximum - minimum
+
+        def ret(v):
+            if minimum <= v < maximum:
+                return v
+            return minimum + (v - minimum) % span
+
+        return ret
 
 
 class Within(AssertValidation):
     """
     An assertion validation that raises an error if the value falls outside of bounds.
     """
+    __slots__ = 'ge', 'lt', 'g_eq', 'l_eq'
 
     def __init__(self, ge: Any = least, lt: Any = greatest, g_eq=True, l_eq=False, **kwargs):
         """
@@ -132,11 +158,29 @@ class Within(AssertValidation):
 
         return True
 
+    def __call__(self, *_):
+        cls = type(self)
+        if cls.assert_ is not Within.assert_ or cls.inner is not AssertValidation.inner \
+                or cls._raise is not AssertValidation._raise:
+            # the generated callback replicates the default validation, it can't be used if any part of it is overridden
+            return super().__call__(*_)
+        # the bounds' inclusivity is fixed, so we generate a callback with the right comparisons built in
+        lower = '<=' if self.g_eq else '<'
+        upper = '>=' if self.l_eq else '>'
+        source = '\n'.join((
+            'def within(v):',
+            f'    if not (ge {lower} v and lt {upper} v):',
+            '        raise_()',
+            '    return v',
+        ))
+        return compile_function(source, 'within', {'ge': self.ge, 'lt': self.lt, 'raise_': self._raise})
+
 
 class FullMatch(AssertValidation):
     """
     An assertion validation that raises an error if the value does not match a regex pattern.
     """
+    __slots__ = 'pattern', '_literal'
 
     def __init__(self, pattern: Union[Pattern, str, bytes], **kwargs):
         """
@@ -148,8 +192,17 @@ class FullMatch(AssertValidation):
         """
         super().__init__(**kwargs)
         self.pattern = extras.re.compile(pattern)
+        source = self.pattern.pattern
+        # a pattern with no special characters and default flags only matches its own source
+        if extras.re.escape(source) == source and self.pattern.flags == extras.re.compile(source[:0]).flags:
+            self._literal = source
+        else:
+            self._literal = None
 
     def assert_(self, v) -> bool:
+        literal = self._literal
+        if literal is not None and type(v) is type(literal):
+            return v == literal
         return bool(self.pattern.fullmatch(v))
 
 
@@ -157,6 +210,7 @@ class Truth(AssertValidation):
     """
     An assertion validation that raises an error if the value does not evaluate as True.
     """
+    __slots__ = ()
 
     def assert_(self, v) -> bool:
         return bool(v)
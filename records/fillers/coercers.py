@@ -2,13 +2,14 @@ from abc import ABC, abstractmethod
 from typing import Any, Callable, Generic, Mapping, Optional, Type, TypeVar, Union
 
 from records.fillers.util import _as_instance
+from records.utils.codegen import compose
 
 
 class CoercionToken:
     """
     A base class for all object that should be interpreted as coercers
     """
-    pass
+    __slots__ = ()
 
 
 T = TypeVar('T')
@@ -18,6 +19,7 @@ class GlobalCoercionToken(CoercionToken, ABC):
     """
     A base class for all coercers that can act on multiple kinds of fillers
     """
+    __slots__ = ()
 
     @abstractmethod
     def __call__(self, stored_type: Type[T], filler) -> Callable[[Any], T]:
@@ -33,6 +35,7 @@ class CallCoercion(GlobalCoercionToken, Generic[T]):
     """
     A coercion token to call arbitrary functions
     """
+    __slots__ = 'func', 'args', 'kwargs'
 
     def __init__(self, func: Callable[..., T], *args, **kwargs):
         """
@@ -57,13 +60,25 @@ class CallCoercion(GlobalCoercionToken, Generic[T]):
         return self.func(v, *self.args, **self.kwargs)
 
     def __call__(self, *_):
-        return self.inner
+        if type(self).inner is not CallCoercion.inner:
+            return self.inner
+        func = self.func
+        args = self.args
+        kwargs = self.kwargs
+        if not args and not kwargs:
+            return func
+
+        def ret(v):
+            return func(v, *args, **kwargs)
+
+        return ret
 
 
 class MapCoercion(GlobalCoercionToken, Generic[T]):
     """
     A coercion token to map values by arbitrary, pre-defined mappings
     """
+    __slots__ = 'value_map', 'factory_map'
 
     def __init__(self, value_map: Optional[Mapping[Any, T]] = None,
                  factory_map: Optional[Mapping[Any, Callable[[], T]]] = None):
@@ -82,13 +97,26 @@ class MapCoercion(GlobalCoercionToken, Generic[T]):
         raise TypeError
 
     def __call__(self, *_):
-        return self.inner
+        if type(self).inner is not MapCoercion.inner:
+            return self.inner
+        value_map = self.value_map
+        factory_map = self.factory_map
+
+        def ret(v):
+            if v in value_map:
+                return value_map[v]
+            if v in factory_map:
+                return factory_map[v]()
+            raise TypeError
+
+        return ret
 
 
 class ClassMethodCoercion(GlobalCoercionToken, Generic[T]):
     """
     A coercion token to call a class method in the target class
     """
+    __slots__ = 'method', 'args', 'kwargs'
 
     def __init__(self, method: str, *args, **kwargs):
         """
@@ -102,9 +130,13 @@ class ClassMethodCoercion(GlobalCoercionToken, Generic[T]):
 
     def __call__(self, cls, filler):
         func = getattr(cls, self.method)
+        args = self.args
+        kwargs = self.kwargs
+        if not args and not kwargs:
+            return func
 
         def ret(v):
-            return func(v, *self.args, **self.kwargs)
+            return func(v, *args, **kwargs)
 
         return ret
 
@@ -113,6 +145,7 @@ class ComposeCoercer(GlobalCoercionToken):
     """
     A coercion token to chain two coercion callbacks one after the other
     """
+    __slots__ = 'inner_coercers',
 
     def __init__(self, *inner_coercers: Union[Type[CoercionToken], CoercionToken]):
         """
@@ -128,10 +161,4 @@ class ComposeCoercer(GlobalCoercionToken):
     def __call__(self, cls, filler):
         functors = [filler.get_coercer(t) for t in self.inner_coercers]
         functors.reverse()
-
-        def ret(v):
-            for f in functors:
-                v = f(v)
-            return v
-
-        return ret
+        return compose(functors, 'compose_coercers')
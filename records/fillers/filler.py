@@ -7,6 +7,7 @@ from typing import Any, Callable, Generic, List, Optional, TypeVar, NamedTuple
 from records.fillers.coercers import CoercionToken
 from records.fillers.util import _as_instance
 from records.fillers.validators import ValidationToken
+from records.utils.codegen import compose
 
 """
 Each field filling has multiple stages:
@@ -114,6 +115,13 @@ class Filler(Generic[T]):
             raise RuntimeError(f'filler is already bound to {self.owner}')
         self.owner = owner_cls
 
+    def freeze(self):
+        """
+        Called once the owner record class has finished binding the filler. After freezing, the filler's callbacks are
+         final, and may be compiled for faster filling. Fillers that contain other fillers must freeze them as well.
+        """
+        pass
+
     @abstractmethod
     def is_hollow(self) -> bool:
         """
@@ -121,6 +129,17 @@ class Filler(Generic[T]):
         """
         pass
 
+    def match(self, arg) -> Optional[TypePassKind]:
+        """
+        Estimate how an argument would pass the filler's type checking, without filling it.
+        :param arg: The argument to check.
+        :return: A lower bound of the ``type_pass_kind`` that `fill` would return for ``arg``, or ``None`` if filling
+         ``arg`` is certain to fail.
+        .. note::
+            By default, no estimation is made and the best possible pass kind is returned.
+        """
+        return TypePassKind.no_coerce_strict
+
     @abstractmethod
     def apply(self, token):
         """
@@ -189,6 +208,7 @@ class AnnotatedFiller(Filler, Generic[T]):
                 # perform coercion
                 if not self.coercers:
                     raise TypeError(f'failed type checking for value of type {type(arg)}')
+                last_index = len(self.coercers) - 1
                 for i, coercer in enumerate(self.coercers):
                     try:
                         arg = coercer(arg)
@@ -197,18 +217,28 @@ class AnnotatedFiller(Filler, Generic[T]):
                                 or (tc == TypeMatch.inexact and self.type_checking_style != TypeCheckStyle.check):
                             raise TypeError(f'coercer returned value of wrong type: {type(arg)}')
                     except Exception:
-                        if i == len(self.coercers) - 1:
+                        if i == last_index:
                             raise
                     else:
                         break
                 tpk = TypePassKind.coerce
 
         # validation
-        for validator in self.validators:
-            arg = validator(arg)
+        if self.validators:
+            arg = self._validate(arg)
 
         return FillingSuccess(arg, tpk)
 
+    def _validate(self, arg):
+        """
+        Run all the validators on an argument.
+        .. note::
+            This method is overridden by a compiled function when the filler is frozen.
+        """
+        for validator in self.validators:
+            arg = validator(arg)
+        return arg
+
     def bind(self, owner_cls):
         for arg in self.args:
             self.apply(arg)
@@ -218,6 +248,12 @@ class AnnotatedFiller(Filler, Generic[T]):
         if self.type_checking_style == TypeCheckStyle.hollow and self.coercers:
             raise ValueError('cannot have hollow type checking with coercers')
 
+    def freeze(self):
+        super().freeze()
+        self.coercers = tuple(self.coercers)
+        self.validators = tuple(self.validators)
+        self._validate = compose(self.validators, 'validate')
+
     def __call__(self, arg):
         if self.type_checking_style is TypeCheckStyle.hollow and not self.validators:
             return arg
@@ -270,3 +306,18 @@ class AnnotatedFiller(Filler, Generic[T]):
 
     def is_hollow(self) -> bool:
         return self.type_checking_style == TypeCheckStyle.hollow
+
+    def match(self, arg) -> Optional[TypePassKind]:
+        if type(self).fill is not AnnotatedFiller.fill:
+            # the estimation below is only valid for the default filling process
+            return super().match(arg)
+        if self.type_checking_style is TypeCheckStyle.hollow:
+            return TypePassKind.hollow
+        tp = self.type_check(arg)
+        if tp is TypeMatch.exact:
+            return TypePassKind.no_coerce_strict
+        if tp is TypeMatch.inexact and self.type_checking_style is TypeCheckStyle.check:
+            return TypePassKind.no_coerce
+        if self.coercers:
+            return TypePassKind.coerce
+        return None
@@ -1,8 +1,14 @@
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
 from records.fillers.builtin_fillers.recurse import GetFiller
-from records.fillers.builtin_fillers.repo import builtin_filler_checkers, builtin_filler_map
+from records.fillers.builtin_fillers.repo import builtin_filler_checkers, builtin_filler_identity_map, \
+    builtin_filler_map
 from records.fillers.filler import Filler, TypeCheckStyle, TypePassKind, FillingSuccess
 from records.utils.typing_compatible import split_annotation
 
+NO_REDIRECT = object()
+
 
 class DumbFiller(Filler):
     """
@@ -27,6 +33,9 @@ class DumbFiller(Filler):
     def is_hollow(self) -> bool:
         return True
 
+    def match(self, arg):
+        return TypePassKind.hollow
+
 
 def get_filler(stored_type) -> Filler:
     """
@@ -38,32 +47,81 @@ def get_filler(stored_type) -> Filler:
     return get_annotated_filler(origin, args)
 
 
-def get_annotated_filler(origin, args: tuple):
+def _resolve_filler_type(origin) -> Tuple[Any, Optional[Callable[[Any, tuple], Filler]]]:
     """
-    get a filler for a type hint with annotations.
+    find the builtin filler class to use for an origin storage type.
     :param origin: the origin storage type.
-    :param args: Annotated arguments for the filler.
-    :return:
+    :return: a tuple of the redirected origin (or ``NO_REDIRECT`` if the origin should be used as-is), and the filler
+     class to construct with it, or ``None`` if no builtin filler matches the origin.
     .. note::
-        usually it's preferable to call `get_filler` with `Annotated`.
+        the result is cached by `_filler_type`, so it must never contain `origin` itself: equal but distinct origins
+        (such as ``Union[int, str]`` and ``Union[str, int]``) share a cache entry.
     """
-    # there are 4 ways a filler is made:
+    # there are 5 ways a filler is made:
     blt = builtin_filler_map.get(origin)
     if blt:
         # a mapping of types to filler classes (for shourtcuts)
-        return blt(origin, args)
-    for checker in builtin_filler_checkers:
-        # builtin functions to create a filler class
-        ret = checker(origin)
-        if isinstance(ret, GetFiller):
-            return get_annotated_filler(ret.new_origin, args)
-        elif ret:
-            return ret(origin, args)
+        return NO_REDIRECT, blt
+    # a mapping of special objects to filler classes or redirections
+    ret = builtin_filler_identity_map.get(origin)
+    if ret is None:
+        for checker in builtin_filler_checkers:
+            # builtin functions to create a filler class
+            ret = checker(origin)
+            if ret:
+                break
+    if isinstance(ret, GetFiller):
+        redirect, filler_cls = _filler_type(ret.new_origin)
+        if redirect is NO_REDIRECT:
+            redirect = ret.new_origin
+        return redirect, filler_cls
+    elif ret:
+        return NO_REDIRECT, ret
     if isinstance(origin, type):
         # run through all classes in the mapping checking for subtypes
         blt_supertype = next((k for (k, v) in builtin_filler_map.items() if issubclass(origin, k)), None)
         if blt_supertype:
-            return builtin_filler_map[blt_supertype](origin, args)
+            return NO_REDIRECT, builtin_filler_map[blt_supertype]
+    return NO_REDIRECT, None
+
+
+# the cache holds references to the origins, so it is bounded to not keep discarded classes and type hints alive
+_cached_resolve_filler_type = lru_cache(maxsize=1024, typed=True)(_resolve_filler_type)
+
+
+def _filler_type(origin):
+    """
+    a cached version of `_resolve_filler_type`, falling back to the uncached version for unhashable origins
+    """
+    try:
+        hash(origin)
+    except TypeError:
+        return _resolve_filler_type(origin)
+    return _cached_resolve_filler_type(origin)
+
+
+def clear_filler_type_cache():
+    """
+    clear the cached filler classes of origin storage types. Must be called if the builtin filler mappings or checkers
+     are changed after fillers have been created.
+    """
+    _cached_resolve_filler_type.cache_clear()
+
+
+def get_annotated_filler(origin, args: tuple):
+    """
+    get a filler for a type hint with annotations.
+    :param origin: the origin storage type.
+    :param args: Annotated arguments for the filler.
+    :return:
+    .. note::
+        usually it's preferable to call `get_filler` with `Annotated`.
+    """
+    redirect, filler_cls = _filler_type(origin)
+    if redirect is not NO_REDIRECT:
+        origin = redirect
+    if filler_cls:
+        return filler_cls(origin, args)
     if args:
         raise TypeError(f'cannot have Annotated type with origin {origin}')
     # finally, return a dumb filler
@@ -8,7 +8,7 @@ class ValidationToken:
     """
     A base class for all object that should be interpreted as validators
     """
-    pass
+    __slots__ = ()
 
 
 T = TypeVar('T')
@@ -18,6 +18,7 @@ class GlobalValidationToken(ValidationToken, ABC):
     """
     A base class for all validators that can act on multiple kinds of fillers
     """
+    __slots__ = ()
 
     @abstractmethod
     def __call__(self, stored_type: Type[T], filler) -> Callable[[Any], T]:
@@ -33,6 +34,7 @@ class AssertValidation(GlobalValidationToken, ABC):
     """
     A validation token to check that a condition is upheld
     """
+    __slots__ = 'err', 'warn'
 
     def __init__(self, *, err: Union[str, Exception] = 'validation failed', warn: Union[bool, Logger] = False):
         """
@@ -90,6 +92,8 @@ class AssertCallValidation(AssertValidation, Generic[T]):
     """
     An assertion validation token to call arbitrary functions
     """
+    __slots__ = 'func',
+
     def __init__(self, func: Callable[[T], bool], **kwargs):
         """
         :param func: the assertion function
@@ -106,6 +110,8 @@ class CallValidation(GlobalValidationToken, Generic[T]):
     """
     An validation token to call arbitrary functions
     """
+    __slots__ = 'func', 'args', 'kwargs'
+
     def __init__(self, func: Callable[..., T], *args, **kwargs):
         """
         :param func: The callable to use as the validation callback.
@@ -129,4 +135,15 @@ class CallValidation(GlobalValidationToken, Generic[T]):
         return self.func(v, *self.args, **self.kwargs)
 
     def __call__(self, *_):
-        return self.inner
+        if type(self).inner is not CallValidation.inner:
+            return self.inner
+        func = self.func
+        args = self.args
+        kwargs = self.kwargs
+        if not args and not kwargs:
+            return func
+
+        def ret(v):
+            return func(v, *args, **kwargs)
+
+        return ret
@@ -3,8 +3,8 @@ from __future__ import annotations
 from collections import ChainMap
 from copy import deepcopy
 from inspect import getattr_static
-from typing import AbstractSet, Any, Callable, ClassVar, Container, Dict, List, Mapping, Optional, TypeVar, Union, \
-    NamedTuple
+from typing import AbstractSet, Any, Callable, ClassVar, Container, Dict, Iterable, List, Mapping, Optional, Tuple, \
+    Type, TypeVar, Union, NamedTuple
 from warnings import warn
 
 import records.extras as extras
@@ -12,6 +12,7 @@ from records.field import NO_DEFAULT, SKIP_FIELD, FieldDict, RecordField
 from records.fillers.filler import TypeCheckStyle
 from records.select import Exporter, NoArgExporter, SelectableFactory, SpecializedShortcutFactory, Select
 from records.tags import Tag
+from records.utils.codegen import compile_function
 from records.utils.typing_compatible import get_type_hints
 
 try:
@@ -46,6 +47,68 @@ class ParseFailure(TypeError):
     pass
 
 
+def _fill_error(name: str, e: Exception) -> Exception:
+    """
+    create the error to raise when filling a field has failed
+    :param name: the name of the field
+    :param e: the error raised by the field's filler
+    :return: an error to raise from ``e``
+    """
+    msg = f'error filling filling {name}'
+    # try to create a parent error of the same type as the original error
+    try:
+        return type(e)(msg)
+    except TypeError:
+        return ValueError(msg)
+
+
+def _make_fill_values(cls) -> Callable[..., Optional[Dict[str, Any]]]:
+    """
+    generate a function to fill all the fields of a record class from keyword arguments
+    :param cls: the record class, after all its fields have been bound
+    :return: a function that accepts the keyword arguments passed to the class, and returns the filled values of all
+     fields, including defaults. If the function's second argument is true, it returns ``None`` if a filler fails,
+     rather than raising an error.
+    .. note::
+        The function is generated from source, so that the fillers and the fields with defaults are all constants,
+        and constructing an instance does not need to iterate over the fields to check for defaults. The default
+        values themselves are still read from the fields at call time.
+    """
+    namespace = {'field_keys': cls._fields.keys(), 'required_keys': cls._required_keys,
+                 'fillers': {name: field.filler for (name, field) in cls._fields.items_tuple},
+                 'fill_error': _fill_error, 'type_name': cls.__qualname__}
+    lines = [
+        'def fill_values(kwargs, soft=False):',
+        '    if not (kwargs.keys() <= field_keys):',
+        '        redundant = kwargs.keys() - field_keys',
+        "        raise TypeError(f'arguments {redundant} invalid for type {type_name}')",
+        '    values = {}',
+        # fields are filled in the order of the arguments, so the first bad argument is the one reported
+        '    for k, v in kwargs.items():',
+        '        try:',
+        '            values[k] = fillers[k](v)',
+        '        except Exception as e:',
+        '            if soft:',
+        '                return None',
+        '            raise fill_error(k, e) from e',
+        '    if not (required_keys <= kwargs.keys()):',
+        '        required = required_keys.difference(kwargs)',
+        "        raise TypeError(f'missing required arguments: {tuple(required)}')",
+    ]
+    for i, (name, field) in enumerate(cls._fields.items_tuple):
+        bit = 1 << i
+        if not (cls._default_bits & bit):
+            continue
+        namespace[f'field_{i}'] = field
+        call = '()' if (cls._factory_bits & bit) else ''
+        lines.extend((
+            f'    if {name!r} not in values:',
+            f'        values[{name!r}] = field_{i}.default{call}',
+        ))
+    lines.append('    return values')
+    return compile_function('\n'.join(lines), 'fill_values', namespace)
+
+
 T = TypeVar('T')
 FORBIDDEN_CLASS_ATTRS = ('__init__', '__setattr__', '__hash__')
 
@@ -63,6 +126,10 @@ class RecordBase:
     """a (immutable) set of field names that have no default value"""
     _optional_keys: ClassVar[AbstractSet[str]]
     """a (immutable) set of field names that have a default value"""
+    _default_bits: ClassVar[int]
+    """a bitmap of the fields that have a default value, bit ``i`` is set if the ``i``-th field has a default"""
+    _factory_bits: ClassVar[int]
+    """a bitmap of the fields that have a default factory, bit ``i`` is set if the ``i``-th field has a factory"""
     _default_type_check_style: ClassVar[TypeCheckStyle]
     """the default type check style that fillers can use if they have none defined"""
     _frozen: ClassVar[bool]
@@ -73,6 +140,8 @@ class RecordBase:
     """a mutable list of parsers"""
     _ordered: ClassVar[bool]
     """whether the class is ordered"""
+    _fill_values: ClassVar[Callable[..., Optional[Dict[str, Any]]]]
+    """a generated function to fill the values of all fields from keyword arguments"""
 
     def __init_subclass__(cls, *, frozen: bool = False, unary_parse: Optional[bool] = None, ordered=False,
                           default_type_check=TypeCheckStyle.hollow, **kwargs):
@@ -122,7 +191,7 @@ class RecordBase:
                     raise ValueError(f'cannot override inherited field {k}')
                 parent_fields[k] = field
         if parent_fields:
-            cls._fields = {**parent_fields, **cls._fields}
+            cls._fields = FieldDict({**parent_fields, **cls._fields})
 
         if any(b for b in cls.__bases__ if b.__init__ not in (RecordBase.__init__, object.__init__)):
             warn(f'class {cls} has parents that implement __init__, the initializer will not be called!')
@@ -130,6 +199,8 @@ class RecordBase:
         if not cls._fields:
             raise ValueError(f'class {cls.__name__} has no fields')
 
+        cls._default_bits = sum(1 << i for (i, (_, f)) in enumerate(cls._fields.items_tuple) if f.has_default)
+        cls._factory_bits = sum(1 << i for (i, (_, f)) in enumerate(cls._fields.items_tuple) if f.default_is_factory)
         cls._required_keys = {k for (k, f) in cls._fields.items() if not f.has_default}
         cls._optional_keys = {k for k in cls._fields if k not in cls._required_keys}
         if unary_parse is None:
@@ -150,6 +221,9 @@ class RecordBase:
             if field.owner is not cls:
                 continue
             field.filler.bind(cls)
+            field.filler.freeze()
+
+        cls._fill_values = _make_fill_values(cls)
 
         cls._parsers = []
         for name in dir(cls):
@@ -204,31 +278,11 @@ class RecordBase:
                 raise TypeError(f'duplicate {arg_key}')
             kwargs[arg_key] = arg
 
-        values = {}
-        if not (kwargs.keys() <= cls._fields.keys()):
-            redundant = kwargs.keys() - cls._fields.keys()
-            raise TypeError(f'arguments {redundant} invalid for type {cls.__qualname__}')
-
-        for k, v in kwargs.items():
-            try:
-                values[k] = cls._fields[k].filler(v)
-            except Exception as e:
-                # if filling failed, check if we have a parsing standing by
-                if parsing is not None:
-                    return parsing
-                msg = f'error filling filling {k}'
-                # try to create a parent error of the same type as the original error
-                try:
-                    parent_error = type(e)(msg)
-                except TypeError:
-                    parent_error = ValueError(msg)
-
-                raise parent_error from e
-        if not (cls._required_keys <= kwargs.keys()):
-            required = cls._required_keys.difference(kwargs)
-            raise TypeError(f'missing required arguments: {tuple(required)}')
-        for k in cls._optional_keys.difference(kwargs):
-            values[k] = cls._fields[k].make_default()
+        # if we have a parsing standing by, a failed filler returns None instead of raising, so that we can return
+        # the parsing. Invalid or missing arguments still raise.
+        values = cls._fill_values(kwargs, parsing is not None)
+        if values is None:
+            return parsing
 
         self = super().__new__(cls)
         # we set directly into __dict__ because the class may be frozen and setattr would fail us
@@ -283,7 +337,7 @@ class RecordBase:
             return False
         if type(self).is_frozen() and hash(self) != hash(other):
             return False
-        for name in self._fields:
+        for name, _ in self._fields.items_tuple:
             if getattr(self, name) != getattr(other, name):
                 return False
         return True
@@ -448,6 +502,37 @@ class RecordBase:
         """
         return ChainMap(*maps, dict(**kwargs))
 
+    @classmethod
+    def many_from_mappings(cls: Type[T], maps: Iterable[Mapping[str, Any]]) -> Tuple[T, ...]:
+        """
+        Convert many mappings to Record instances.
+
+        :param maps: An iterable of mappings, each holding the field values of a single instance.
+
+        :return: A tuple of instances of ``cls``, one for each mapping in ``maps``, in order.
+
+        .. note::
+            This is equivalent to calling ``cls(**m)`` for each mapping ``m`` in ``maps``, but skips the handling of
+            the constructor's positional argument, and so is faster for many mappings.
+        .. note::
+            Unlike `from_mapping`, this method is not a registered parser, and does not support selection.
+        """
+        # all the lookups are done once, outside of the loop
+        fill_values = cls._fill_values
+        new = super().__new__
+        frozen = cls._frozen
+        post_new = cls.post_new
+        ret = []
+        append = ret.append
+        for m in maps:
+            values = fill_values(m)
+            self = new(cls)
+            self.__dict__.update(values)
+            if frozen:
+                self._hash = None
+            append(post_new(self) or self)
+        return tuple(ret)
+
     @SpecializedShortcutFactory
     @classmethod
     def from_instance(cls, v, *maps: Mapping[str, Any], _select=Select.empty, **kwargs):
@@ -655,7 +740,7 @@ class RecordBase:
     def __ordering_key(self):
         f: RecordField
         ret = []
-        for k, f in type(self)._fields.items():
+        for k, f in type(self)._fields.items_tuple:
             if exclude_from_ordering in f.tags:
                 continue
             ret.append(getattr(self, k))
@@ -6,6 +6,8 @@ class Tag:
     A tag to mark a Field as belonging to a category. Tags encapsulate a single hashable object and implement only
     hashing and equality.
     """
+    __slots__ = 'inner',
+
     def __init__(self, x: Hashable):
         self.inner = x
 
@@ -13,7 +15,7 @@ class Tag:
         return hash(self.inner)
 
     def __eq__(self, other):
-        return type(other) == type(self) \
+        return type(other) is type(self) \
                and self.inner == other.inner
 
     def __repr__(self):
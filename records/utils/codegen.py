@@ -0,0 +1,30 @@
+from typing import Any, Callable, Dict, Sequence
+
+
+def compile_function(source: str, name: str, namespace: Dict[str, Any]) -> Callable:
+    """
+    Compile a specialized function from generated source code.
+    :param source: The source code of the function definition.
+    :param name: The name of the function defined in ``source``.
+    :param namespace: The global namespace the function will run in. Will be mutated.
+    :return: The function defined in ``source``.
+    """
+    code = compile(source, f'<records generated {name}>', 'exec')
+    exec(code, namespace)
+    return namespace[name]
+
+
+def compose(funcs: Sequence[Callable[[Any], Any]], name: str = 'composed') -> Callable[[Any], Any]:
+    """
+    Compose single-argument functions into a single function.
+    :param funcs: The functions to compose, in the order they should be called.
+    :param name: The name of the generated function.
+    :return: A function that calls each of ``funcs`` on the result of the previous one, in straight-line code.
+    """
+    if len(funcs) == 1:
+        return funcs[0]
+    namespace = {f'func_{i}': f for i, f in enumerate(funcs)}
+    lines = [f'def {name}(v):']
+    lines.extend(f'    v = func_{i}(v)' for i in range(len(funcs)))
+    lines.append('    return v')
+    return compile_function('\n'.join(lines), name, namespace)
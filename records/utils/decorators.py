@@ -1,25 +1,36 @@
 from functools import wraps
 
 
-def decorator_kw_method(func):
+def identity_cache(maxsize: int = 1024):
     """
-    A decorator to apply to other decorator methods, to allow them to delay calling with keyword arguments.
+    A decorator to cache the results of a single-argument function by the identity of its argument.
+    Unlike :py:func:`functools.lru_cache`, the argument does not need to be hashable, and equal but distinct arguments
+    (such as ``Union[int, str]`` and ``Union[str, int]``) are cached separately.
+    .. note::
+        The cache holds a reference to all cached arguments, so that their ids cannot be reused while cached. Once the
+        cache reaches ``maxsize`` entries, it is cleared.
     .. example::
-        >>> @decorator_kw_method
-        >>> def foo(func, *, a=0):
-        >>>     ...
-        >>> @foo
-        >>> def bar0():
-        >>>     ...
-        >>> @foo(a=3)
-        >>> def bar3():
+        >>> @identity_cache()
+        >>> def foo(arg):
         >>>     ...
     """
 
-    @wraps(func)
-    def ret(self, f=None, **kwargs):
-        if f is None:
-            return lambda f: ret(self, f, **kwargs)
-        return func(self, f, **kwargs)
+    def decorator(func):
+        cache = {}
+
+        @wraps(func)
+        def ret(arg):
+            key = id(arg)
+            entry = cache.get(key)
+            if entry is not None:
+                return entry[1]
+            result = func(arg)
+            if len(cache) >= maxsize:
+                cache.clear()
+            cache[key] = (arg, result)
+            return result
+
+        ret.cache_clear = cache.clear
+        return ret
 
-    return ret
+    return decorator
@@ -6,6 +6,8 @@ import sys
 from functools import partial
 from typing import Callable, get_type_hints
 
+from records.utils.decorators import identity_cache
+
 if sys.version_info >= (3, 8, 0):
     from typing import get_args, get_origin
 else:
@@ -52,11 +54,27 @@ else:
             return _args(v) or getattr(v, '__args__', None)
 
 
+# type hints are usually defined once and reused in many classes and fields, so the introspection results are cached
+get_origin = identity_cache()(get_origin)
+get_args = identity_cache()(get_args)
+
+
+@identity_cache()
 def split_annotation(v):
     if not is_annotation(v):
         return v, ()
     t, *args = get_args(v)
-    return t, args
+    return t, tuple(args)
+
+
+@identity_cache()
+def split_union(v):
+    """
+    :param v: a union type hint.
+    :return: a tuple of the split origin and annotations (as by `split_annotation`) of each member of the union.
+    """
+    return tuple(split_annotation(a) for a in get_args(v))
 
 
-__all__ = ['get_args', 'get_origin', 'Annotated', 'get_type_hints', 'is_annotation', 'split_annotation']
+__all__ = ['get_args', 'get_origin', 'Annotated', 'get_type_hints', 'is_annotation', 'split_annotation',
+           'split_union']
@@ -1,9 +1,15 @@
+import sys
+from abc import ABC
+from collections.abc import Sized
 from numbers import Number
 from typing import Any, Callable, Dict, Iterable, List, Mapping, NewType, Sequence, Tuple, Type, Union
+from unittest.mock import Mock
 
 from pytest import mark, raises
 
 from records import Annotated, RecordBase, TypeCheckStyle
+from records.fillers.builtin_fillers.typing_fillers import WrapperFiller
+from records.fillers.filler import TypePassKind
 
 try:
     from typing import Literal
@@ -102,6 +108,31 @@ def test_literal():
         A(False)
 
 
+@mark.skipif(Literal is None, reason='Literal cannot be imported')
+def test_literal_equal_values_of_other_types():
+    A = ACls(Literal[1, 2.0])
+    assert type(A(2.0).x) is float
+    with raises(ValueError):
+        A(2)
+    with raises(ValueError):
+        A(1.0)
+
+
+@mark.skipif(Literal is None, reason='Literal cannot be imported')
+def test_literal_single_type():
+    class S(str):
+        pass
+
+    A = ACls(Literal['a', 'b'])
+    assert A('a').x == 'a'
+    with raises(ValueError):
+        A('c')
+    with raises(ValueError):
+        A(S('a'))
+    with raises(TypeError):
+        A(1)
+
+
 @mark.parametrize('T', [None, type(None)])
 def test_none(T):
     A = ACls(T)
@@ -158,6 +189,14 @@ def test_type():
         A(156)
 
 
+@mark.parametrize('T', [object, Any])
+def test_type_of_any(T):
+    A = ACls(Type[T])
+    assert A(int).x is int
+    with raises(TypeError):
+        A(156)
+
+
 def test_tuple_reg():
     A = ACls(Tuple[Annotated[int, TypeCheckStyle.check], Annotated[str, TypeCheckStyle.check]])
     a = A((5, '6'))
@@ -250,6 +289,38 @@ def test_complex_union():
         A(['str'])
 
 
+class _RaisingMeta(type):
+    def __instancecheck__(cls, instance):
+        raise RuntimeError('cannot check instances')
+
+
+class Weird(metaclass=_RaisingMeta):
+    pass
+
+
+def test_union_raising_check():
+    A = ACls(Union[Weird, Sequence])
+    assert A([1]).x == [1]
+    A = ACls(Union[Weird, int])
+    assert A(True).x is True
+
+
+def test_wrapper_fill_override_match():
+    class IntParsing(WrapperFiller):
+        def fill(self, arg):
+            return super().fill(int(arg))
+
+    class A(RecordBase):
+        x: int
+
+    filler = IntParsing(int, (TypeCheckStyle.check,))
+    filler.bind(A)
+    filler.freeze()
+    assert filler.inner_filler.match('3') is None
+    assert filler.match('3') is not None
+    assert filler.fill('3') == (3, TypePassKind.no_coerce_strict)
+
+
 def test_double_union():
     A = ACls(Union[bool, int])
     a = A(1)
@@ -278,3 +349,69 @@ def test_any(T):
     c = object()
     a = A(c)
     assert a.x == c
+
+
+def test_abc_register_after_check():
+    class Base(ABC):
+        pass
+
+    class Derived:
+        pass
+
+    A = ACls(Base)
+    with raises(TypeError):
+        A(Derived())
+    Base.register(Derived)
+    d = Derived()
+    assert A(d).x is d
+
+
+def test_shared_hint():
+    T = Union[int, str]
+
+    class A(RecordBase, default_type_check=TypeCheckStyle.check):
+        x: T
+
+    class B(RecordBase):
+        x: T
+        y: T
+
+    with raises(TypeError):
+        A(1.5)
+    assert B(x=1.5, y='a').x == 1.5
+
+
+@mark.skipif(sys.version_info < (3, 10), reason='union operator requires python 3.10')
+def test_union_operator():
+    A = ACls(int | str)
+    assert A(1).x == 1
+    assert A('a').x == 'a'
+    with raises(TypeError):
+        A(1.5)
+
+
+def test_abc_proxy_class():
+    class Proxy:
+        def __init__(self, cls):
+            self.cls = cls
+
+        @property
+        def __class__(self):
+            return self.cls
+
+    A = ACls(Sized)
+    assert A(Proxy(list)).x.cls is list
+    with raises(TypeError):
+        A(Proxy(int))
+    B = ACls(Sized)
+    with raises(TypeError):
+        B(Proxy(int))
+    assert B(Proxy(list)).x.cls is list
+
+
+def test_final_type_mock():
+    A = ACls(bool)
+    m = Mock(spec=bool)
+    assert A(m).x is m
+    with raises(TypeError):
+        A(Mock(spec=int))
@@ -2,7 +2,7 @@ from collections import defaultdict, deque, namedtuple
 from enum import Enum
 from fractions import Fraction
 from re import Pattern, compile
-from typing import DefaultDict, Deque, Iterable, Mapping, Sequence, Tuple, Union, List
+from typing import Callable, DefaultDict, Deque, Iterable, Mapping, Sequence, Tuple, Union, List
 
 from pytest import mark, raises
 
@@ -11,6 +11,11 @@ from records import (Annotated, CallCoercion, ClassMethodCoercion, ComposeCoerce
                      check, check_strict, LiteralEval)
 from records.fillers.builtin_fillers.std_fillers import ToBytes
 
+try:
+    from typing import Literal
+except ImportError:
+    Literal = None
+
 
 def ACls(T, *args):
     annotated = Annotated.__class_getitem__((T, TypeCheckStyle.check, *args))
@@ -79,6 +84,25 @@ def test_loose_unpack_map():
         a(10)
 
 
+def test_loose_func_args_override():
+    class Halved(Loose):
+        def func_args(self, origin, v):
+            return origin(v) // 2
+
+    class Reversed(LooseUnpack):
+        def func_args(self, origin, v):
+            return origin(*reversed(v))
+
+    class Defaulted(LooseUnpackMap):
+        def func_args(self, origin, v):
+            return origin(**{'c': 5, **v})
+
+    t = namedtuple('t', 'a b c')
+    ACls(int, Halved)('8', 4)
+    ACls(range, Reversed)((10, 1), range(1, 10))
+    ACls(t, Defaulted)({'a': 1, 'b': 2}, t(1, 2, 5))
+
+
 def test_whole():
     a = ACls(int, TypeCheckStyle.check_strict, Whole)
     a(3, 3)
@@ -96,6 +120,24 @@ def test_whole():
         a(1 + 1j)
 
 
+def test_whole_falsish_func_args_override():
+    class Doubled(Whole):
+        def func_args(self, origin, v):
+            return origin(self.whole_value(v)) * 2
+
+    class NoneOnly(Falsish):
+        def func_args(self, origin, v):
+            if v is None:
+                return origin()
+            raise TypeError
+
+    ACls(int, TypeCheckStyle.check_strict, Doubled)(3.0, 6)
+    a = ACls(list, NoneOnly)
+    a(None, [])
+    with raises(TypeError):
+        a(0)
+
+
 def test_from_bytes():
     a = ACls(int, ClassMethodCoercion('from_bytes', byteorder='big'))
     a(6, 6)
@@ -108,6 +150,13 @@ def test_from_bytes():
         a([300])
 
 
+def test_class_method_no_args():
+    a = ACls(Fraction, ClassMethodCoercion('from_float'))
+    a(Fraction(1, 3), Fraction(1, 3))
+    a(0.5, Fraction(1, 2))
+    a(2, Fraction(2))
+
+
 def test_to_bytes():
     a = ACls(bytearray, ToBytes(byteorder='big'))
     a(bytearray(b'23'), bytearray(b'23'))
@@ -258,6 +307,17 @@ def test_inner_coercer_map():
     a({64: 8, 9: 3}, {9: 3.0, 64: 8.0})
 
 
+def test_inner_coercer_map_identity():
+    class A(RecordBase):
+        x: Annotated[Mapping[int, Annotated[float, check, Loose]], check]
+
+    unchanged = {1: 1.0, 2: 2.0}
+    assert A(unchanged).x is unchanged
+    changed = A({1: 1.0, 2: 2, 3: 3.0}).x
+    assert list(changed.items()) == [(1, 1.0), (2, 2.0), (3, 3.0)]
+    assert type(changed[2]) is float
+
+
 def test_inner_coercer_defaultmap():
     a = ACls(DefaultDict[int, Annotated[float, TypeCheckStyle.check, Loose]], TypeCheckStyle.check)
     a(defaultdict(lambda: -1.0, {}), defaultdict(lambda: -1.0, {}))
@@ -314,6 +374,14 @@ def test_eval_enum():
         a('1')
 
 
+def test_eval_walrus_nested_scope():
+    a = ACls(int, Eval(sum=sum))
+    a('(b:=2) + sum([b for _ in "xx"])', 6)
+    a('(f:=lambda n: n and n + f(n-1)) and f(3)', 6)
+    with raises(TypeError):
+        a('b')
+
+
 def test_eval_ellipsis():
     class E(Enum):
         x = 1
@@ -437,6 +505,17 @@ def test_sub_filler_union():
     assert A(b'hello there') == A('hello there')
 
 
+def test_sub_filler_union_order():
+    class A(RecordBase, default_type_check=check):
+        x: Union[float, str]
+
+    class B(RecordBase, default_type_check=check):
+        x: Union[str, float]
+
+    assert A.x.filler.sub_filler(0).origin is float
+    assert B.x.filler.sub_filler(0).origin is str
+
+
 def test_identical_union():
     class A:
         pass
@@ -452,3 +531,45 @@ def test_identical_union():
 
     c = C()
     assert R(c).x is c
+
+
+def test_literal_eval_single_pass():
+    a = ACls(list, LiteralEval)
+    a('[1]', [1])
+    with raises(TypeError):
+        a('"[1]"')
+
+
+def test_callable_coercer_wrong_type():
+    class A(RecordBase):
+        x: Annotated[Callable, check, CallCoercion(lambda v: v)]
+
+    assert A(len).x is len
+    with raises(TypeError):
+        A(5)
+
+
+@mark.skipif(Literal is None, reason='Literal cannot be imported')
+def test_literal_coercer_wrong_type():
+    class A(RecordBase):
+        x: Annotated[Literal[1, 2], check, CallCoercion(str)]
+
+    assert A(1).x == 1
+    with raises(TypeError):
+        A(3.0)
+
+
+def test_union_skips_worse_coercers():
+    calls = []
+
+    def coerce(v):
+        calls.append(v)
+        return str(v)
+
+    class A(RecordBase):
+        x: Union[Annotated[str, check, CallCoercion(coerce)], Annotated[int, check]]
+
+    assert A(3).x == 3
+    assert calls == []
+    assert A(3.5).x == '3.5'
+    assert calls == [3.5]
@@ -151,3 +151,11 @@ def test_select_frominstance(Point):
     assert p == Point(x=1, y=2)
     p = Point.from_instance.select(keys_to_remove='Y', keys_to_add=[('y', 2)])(mp)
     assert p == Point(x=1, y=2)
+
+
+def test_many_from_mappings(Point):
+    points = Point.many_from_mappings([{'x': 1, 'y': 2}, {'x': 3, 'y': 4, 'z': 5}])
+    assert points == (Point(x=1, y=2), Point(x=3, y=4, z=5))
+    assert Point.many_from_mappings(()) == ()
+    with raises(TypeError):
+        Point.many_from_mappings([{'x': 1, 'y': 2}, {'x': 1}])
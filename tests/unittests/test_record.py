@@ -1,10 +1,14 @@
+import gc
+import sys
+import weakref
 from math import isclose
 from types import SimpleNamespace
 from typing import ClassVar, Dict, Hashable, List, Set
 
 from pytest import fixture, mark, raises, skip
 
-from records import Annotated, Factory, RecordBase, Tag, check
+from records import Annotated, Factory, RecordBase, Tag, check, parser
+from records.field import FieldDict
 from records.select import Select
 
 try:
@@ -339,6 +343,34 @@ def test_get_by_tag():
     assert A._fields.filter_by_tag(Tag(0)) == {'a0': A.a0, 'c0': A.c0}
 
 
+def test_get_by_tag_inherited():
+    class A(RecordBase):
+        a0: Annotated[int, Tag(0)]
+        b1: Annotated[int, Tag(1)]
+
+    class B(A):
+        c0: Annotated[int, Tag(0)]
+
+    assert B._fields.filter_by_tag(Tag(0)) == {'a0': A.a0, 'c0': B.c0}
+    assert [n for (n, _) in B._fields.items_tuple] == ['a0', 'b1', 'c0']
+
+
+@mark.skipif(sys.version_info < (3, 9), reason='dict union operators require python 3.9')
+def test_field_dict_ior():
+    class A(RecordBase):
+        a0: Annotated[int, Tag(0)]
+
+    class B(RecordBase):
+        b0: Annotated[int, Tag(0)]
+
+    fields = FieldDict(A._fields)
+    assert [n for (n, _) in fields.items_tuple] == ['a0']
+    assert fields.filter_by_tag(Tag(0)) == {'a0': A.a0}
+    fields |= B._fields
+    assert [n for (n, _) in fields.items_tuple] == ['a0', 'b0']
+    assert fields.filter_by_tag(Tag(0)) == {'a0': A.a0, 'b0': B.b0}
+
+
 def test_exception_has_field_name():
     class A(RecordBase, default_type_check=check):
         field_one: int
@@ -346,3 +378,65 @@ def test_exception_has_field_name():
 
     with raises(TypeError, match='field_two'):
         A(field_one=12, field_two=11)
+
+
+def test_fill_error_argument_order():
+    class A(RecordBase, default_type_check=check):
+        field_one: int
+        field_two: str
+
+    with raises(TypeError, match='field_two'):
+        A(field_two=11, field_one='12')
+    with raises(TypeError, match='field_one'):
+        A(field_one='12', field_two=11)
+    with raises(TypeError, match='invalid'):
+        A(field_one='12', field_three=11)
+    with raises(TypeError, match='field_one'):
+        A(field_one='12')
+
+
+def test_default_error_with_parsing():
+    def fail():
+        raise RuntimeError
+
+    class A(RecordBase, unary_parse=True):
+        x: str
+        y: int = Factory(fail)
+
+        @parser
+        @classmethod
+        def from_complex(cls, v):
+            if not isinstance(v, complex):
+                raise TypeError
+            return cls(x='parsed', y=0)
+
+    assert A(x='a', y=1).y == 1
+    # the filling succeeded, so the parsing is not used and the factory error is raised
+    with raises(RuntimeError):
+        A(1j)
+
+
+def test_default_read_on_fill():
+    class A(RecordBase):
+        x: int
+        y: int = 0
+
+    assert A(x=1).y == 0
+    A.y.default = 2
+    assert A(x=1).y == 2
+
+
+def test_discarded_field_types_collected():
+    def make():
+        class T:
+            pass
+
+        class A(RecordBase):
+            x: T
+
+        A(x=T())
+        return weakref.ref(T)
+
+    refs = [make() for _ in range(1100)]
+    gc.collect()
+    assert sum(r() is not None for r in refs) <= 1024
@@ -1,10 +1,12 @@
+from math import isnan, nan
+from re import IGNORECASE, compile
 from typing import Any, Iterable, Union
 from unittest.mock import Mock
 
 from pytest import mark, raises, warns
 
-from records import (Annotated, AssertCallValidation, CallValidation, Clamp, Cyclic, FullMatch, Loose, RecordBase,
-                     Truth, TypeCheckStyle, Within, check, parser, SelectableFactory)
+from records import (Annotated, AssertCallValidation, CallCoercion, CallValidation, Clamp, Cyclic, FullMatch, Loose,
+                     MapCoercion, RecordBase, Truth, TypeCheckStyle, Within, check, parser, SelectableFactory)
 
 
 def ACls(T, *args):
@@ -70,6 +72,22 @@ def test_const_clamp():
     a(3, 10)
 
 
+def test_one_sided_clamp():
+    a = ACls(float, Clamp(le=1.0))
+    a(-15.0, -15.0)
+    a(3.0, 1.0)
+    a = ACls(float, Clamp(ge=0.0))
+    a(-15.0, 0.0)
+    a(3.0, 3.0)
+
+
+def test_clamp_nan():
+    class A(RecordBase):
+        x: Annotated[float, Clamp(0.0, 1.0)]
+
+    assert isnan(A(nan).x)
+
+
 def test_bad_clamp():
     with raises(ValueError):
         ACls(int, Clamp(15, 10))
@@ -93,6 +111,21 @@ def test_equation():
         a('a**3')
 
 
+@mark.parametrize('pattern', ['status_ok', compile('status_ok')])
+def test_literal_pattern(pattern):
+    a = ACls(str, FullMatch(pattern))
+    a('status_ok', 'status_ok')
+    with raises(ValueError):
+        a('status_ok ')
+    with raises(ValueError):
+        a('STATUS_OK')
+
+
+def test_literal_pattern_flags():
+    a = ACls(str, FullMatch(compile('status_ok', IGNORECASE)))
+    a('STATUS_OK', 'STATUS_OK')
+
+
 def test_notempty():
     a = ACls(Any, Truth)
     a('hi', 'hi')
@@ -118,6 +151,83 @@ def test_warn_logger():
     logger.warning.assert_called_once()
 
 
+def test_within_subclass():
+    class Anything(Within):
+        __slots__ = ()
+
+        def assert_(self, v) -> bool:
+            return True
+
+    a = ACls(int, Anything(0, 10))
+    a(50, 50)
+
+    class Clipped(Within):
+        __slots__ = ()
+
+        def inner(self, v):
+            return min(v, self.lt - 1)
+
+    a = ACls(int, Clipped(0, 10))
+    a(50, 9)
+
+    raised = []
+
+    class Recorded(Within):
+        __slots__ = ()
+
+        def _raise(self):
+            raised.append(True)
+
+    a = ACls(int, Recorded(0, 10))
+    a(50, 50)
+    assert raised == [True]
+
+
+def test_inner_override():
+    class Doubled(CallValidation):
+        __slots__ = ()
+
+        def inner(self, v):
+            return super().inner(v) * 2
+
+    class ClampOdd(Clamp):
+        __slots__ = ()
+
+        def inner(self, v):
+            return super().inner(v) | 1
+
+    class CyclicNegated(Cyclic):
+        __slots__ = ()
+
+        def inner(self, v):
+            return -super().inner(v)
+
+    class CoercedDoubled(CallCoercion):
+        __slots__ = ()
+
+        def inner(self, v):
+            return super().inner(v) * 2
+
+    class MapDefault(MapCoercion):
+        __slots__ = ()
+
+        def inner(self, v):
+            return self.value_map.get(v, 0)
+
+    ACls(int, Doubled(abs))(-3, 6)
+    ACls(int, ClampOdd(0, 10))(20, 11)
+    ACls(int, CyclicNegated(0, 10))(13, -3)
+    ACls(int, CoercedDoubled(int))('4', 8)
+    ACls(int, MapDefault({'one': 1}))('two', 0)
+
+
+def test_within_warn():
+    a = ACls(int, Within(0, 10, l_eq=True, warn=True))
+    a(10, 10)
+    with warns(UserWarning):
+        a(11, 11)
+
+
 def test_assert_call():
     a = ACls(Iterable, AssertCallValidation(lambda v: len(v) >= 2))
     a('hi', 'hi')
@@ -188,6 +298,37 @@ def test_censor():
     assert A('poopy').x == '****y'
 
 
+def test_validator_order():
+    class A(RecordBase):
+        x: Annotated[str, check]
+
+        @classmethod
+        def pre_bind(cls):
+            super().pre_bind()
+            cls.x.add_validator(str.strip)
+
+            @cls.x.add_validator
+            def upper(v: str):
+                return v.upper()
+
+            @cls.x.add_assert_validator
+            def short(v: str):
+                return len(v) <= 3
+
+    assert A(' foo ').x == 'FOO'
+    with raises(ValueError):
+        A(' fooo ')
+
+
+def test_validator_after_bind():
+    class A(RecordBase):
+        x: Annotated[str, check]
+
+    with raises(RuntimeError):
+        A.x.add_validator(str.strip)
+    assert A(' foo ').x == ' foo '
+
+
 def test_hex():
     class A(RecordBase):
         x: Annotated[int, check]
@@ -263,3 +404,38 @@ def test_post_new_check_with_unary():
         A(a=4, b=3, c=12)
 
     assert A(15) == A(a=15, b=16, c=17)
+
+
+def test_union_strict_validation_fallback():
+    class A(RecordBase):
+        x: Union[Annotated[int, check, Within(0)], Annotated[float, check, Loose]]
+
+    assert type(A(1).x) is int
+    a = A(-1)
+    assert type(a.x) is float
+    assert a.x == -1
+
+
+def test_union_failure_calls_once():
+    validated = []
+    coerced = []
+
+    def validate(v):
+        validated.append(v)
+        return False
+
+    def coerce(v):
+        coerced.append(v)
+        raise ValueError
+
+    class A(RecordBase):
+        x: Union[Annotated[int, check, AssertCallValidation(validate), CallCoercion(coerce)], Annotated[str, check]]
+
+    with raises(TypeError):
+        A(5)
+    assert validated == [5]
+    assert coerced == []
+    with raises(TypeError):
+        A(1.5)
+    assert validated == [5]
+    assert coerced == [1.5]